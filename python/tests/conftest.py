@@ -1,9 +1,8 @@
 """Shared test fixtures for LinodeMCP."""
 
-from collections.abc import Generator
 from pathlib import Path
 from typing import Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 import yaml
@@ -19,11 +18,13 @@ from linodemcp.config import (
     ServerConfig,
     TracingConfig,
 )
+from linodemcp.linode import Instance, parse_instance
+from linodemcp.tools import helpers
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config_data() -> dict[str, Any]:
-    """Sample configuration data."""
+    """Sample configuration data, shared read-only across the session."""
     return {
         "server": {
             "name": "TestLinodeMCP",
@@ -68,9 +69,13 @@ def sample_config_data() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config() -> Config:
-    """Sample Config object."""
+    """Sample Config object, built once and shared by every test.
+
+    Treat it as read-only: a test that needs different settings derives its
+    own copy with ``dataclasses.replace(sample_config, ...)``.
+    """
     return Config(
         server=ServerConfig(
             name="TestLinodeMCP",
@@ -114,6 +119,12 @@ def sample_config() -> Config:
     )
 
 
+@pytest.fixture(scope="session")
+def empty_config() -> Config:
+    """Config with no environments, shared read-only for missing-env tests."""
+    return Config(environments={})
+
+
 @pytest.fixture
 def temp_config_file(tmp_path: Path, sample_config_data: dict[str, Any]) -> Path:
     """Create a temporary config file."""
@@ -122,9 +133,9 @@ def temp_config_file(tmp_path: Path, sample_config_data: dict[str, Any]) -> Path
     return config_file
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_profile_data() -> dict[str, Any]:
-    """Sample Linode profile data."""
+    """Sample Linode profile data, shared read-only across the session."""
     return {
         "username": "testuser",
         "email": "test@example.com",
@@ -136,9 +147,9 @@ def sample_profile_data() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_instance_data() -> dict[str, Any]:
-    """Sample Linode instance data."""
+    """Sample Linode instance data, shared read-only across the session."""
     return {
         "id": 123456,
         "label": "test-instance",
@@ -181,12 +192,26 @@ def sample_instance_data() -> dict[str, Any]:
     }
 
 
+@pytest.fixture(scope="session")
+def sample_instance(sample_instance_data: dict[str, Any]) -> Instance:
+    """sample_instance_data parsed into an Instance, shared read-only.
+
+    Tests needing a variant derive one with ``dataclasses.replace``.
+    """
+    return parse_instance(sample_instance_data)
+
+
 @pytest.fixture
-def mock_linode_client() -> Generator[AsyncMock]:
-    """Mock RetryableClient with async context manager support."""
-    with patch("linodemcp.tools.helpers.RetryableClient") as mock_class:
-        client = AsyncMock()
-        client.__aenter__.return_value = client
-        client.__aexit__.return_value = None
-        mock_class.return_value = client
-        yield client
+def mock_linode_client(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Mock RetryableClient with async context manager support.
+
+    monkeypatch swaps the attribute on the already-imported helpers module
+    directly, so there is no dotted-path resolution per test the way
+    ``patch("linodemcp.tools.helpers.RetryableClient")`` does it.
+    """
+    client = AsyncMock()
+    # __aexit__ is left alone: AsyncMock already awaits it to False, which is
+    # what lets exceptions raised inside ``async with`` propagate.
+    client.__aenter__.return_value = client
+    monkeypatch.setattr(helpers, "RetryableClient", Mock(return_value=client))
+    return client
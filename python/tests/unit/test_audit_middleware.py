@@ -37,7 +37,6 @@ def _full_access(base: Config) -> Config:
     )
 
 
-@pytest.mark.asyncio
 async def test_audit_middleware_records_success(sample_config: Config) -> None:
     """A reaching hello call records one event with success + CapMeta + args."""
     srv = Server(_full_access(sample_config))
@@ -57,7 +56,6 @@ async def test_audit_middleware_records_success(sample_config: Config) -> None:
     assert event.latency_ms >= 0
 
 
-@pytest.mark.asyncio
 async def test_audit_middleware_records_refusal_on_unknown_tool(
     sample_config: Config,
 ) -> None:
@@ -77,7 +75,6 @@ async def test_audit_middleware_records_refusal_on_unknown_tool(
     assert event.error is not None
 
 
-@pytest.mark.asyncio
 async def test_set_audit_sink_none_restores_noop(sample_config: Config) -> None:
     """Passing None restores NoopSink; the previous sink stops receiving."""
     srv = Server(_full_access(sample_config))
@@ -103,7 +100,6 @@ _PII_HELLO_ARGS = {
 }
 
 
-@pytest.mark.asyncio
 async def test_audit_middleware_redacts_pii_when_flag_on(
     sample_config: Config,
 ) -> None:
@@ -135,7 +131,6 @@ async def test_audit_middleware_redacts_pii_when_flag_on(
     assert "token" in event.args_redacted
 
 
-@pytest.mark.asyncio
 async def test_audit_middleware_leaves_pii_when_flag_off(
     sample_config: Config,
 ) -> None:
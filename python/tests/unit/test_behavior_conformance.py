@@ -120,7 +120,6 @@ def _resolve_response(
     return 200, json.dumps(api_responses[key]).encode()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("tool", "case_name", "case"),
     _behavior_cases(),
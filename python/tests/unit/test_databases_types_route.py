@@ -41,7 +41,6 @@ class _CapturingRetryableClient(RetryableClient):
         return await func(*args)
 
 
-@pytest.mark.asyncio
 async def test_client_list_database_types_sends_exact_path_and_query() -> None:
     """Low-level client sends GET /databases/types with documented pagination."""
     seen: list[httpx.Request] = []
@@ -75,7 +74,6 @@ async def test_client_list_database_types_sends_exact_path_and_query() -> None:
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("kwargs", "message"),
     [
@@ -111,7 +109,6 @@ async def test_client_list_database_types_validates_pagination_before_request(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_get_database_type_sends_exact_path_and_query() -> None:
     """Low-level client sends GET /databases/types/{typeId}."""
     seen: list[httpx.Request] = []
@@ -140,7 +137,6 @@ async def test_client_get_database_type_sends_exact_path_and_query() -> None:
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("kwargs", "message", "exc_type"),
     [
@@ -202,7 +198,6 @@ async def test_client_get_database_type_validates_inputs_before_request(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_get_database_type_uses_read_retry() -> None:
     """Read-only database type get goes through the retry wrapper."""
     retryable = _CapturingRetryableClient()
@@ -221,7 +216,6 @@ async def test_retryable_client_get_database_type_uses_read_retry() -> None:
     mock_get.assert_awaited_once_with("g6-dedicated-2", page=1, page_size=25)
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_list_database_types_uses_read_retry() -> None:
     """Read-only database types list goes through the retry wrapper."""
     retryable = _CapturingRetryableClient()
@@ -262,7 +256,6 @@ def test_create_linode_databases_types_list_tool_schema() -> None:
     assert tool.input_schema["properties"]["page_size"]["type"] == "integer"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_database_type_get_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -287,7 +280,6 @@ async def test_handle_linode_database_type_get_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -313,7 +305,6 @@ async def test_handle_linode_database_type_get_rejects_invalid_inputs(
     mock_linode_client.get_database_type.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_databases_types_list_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -349,7 +340,6 @@ async def test_handle_linode_databases_types_list_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -387,7 +377,6 @@ def test_linode_databases_types_list_registered() -> None:
     assert entry.handle_fn is handle_linode_database_type_list
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_databases_engines_list_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -415,7 +404,6 @@ async def test_handle_linode_databases_engines_list_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_databases_engines_list_empty(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
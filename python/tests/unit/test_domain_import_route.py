@@ -19,7 +19,6 @@ from linodemcp.tools.linode_domains_write import (
 from linodemcp.version import FEATURE_TOOLS_LIST
 
 
-@pytest.mark.asyncio
 async def test_client_import_domain_sends_exact_path_and_body() -> None:
     """Low-level client sends POST /domains/import with documented body."""
     seen: list[httpx.Request] = []
@@ -60,7 +59,6 @@ async def test_client_import_domain_sends_exact_path_and_body() -> None:
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("domain", "remote_nameserver", "message"),
     [
@@ -94,7 +92,6 @@ async def test_client_import_domain_validates_inputs_before_request(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_import_domain_does_not_replay_post() -> None:
     """Domain import delegates once and does not use the generic retry wrapper."""
     retryable = RetryableClient("https://api.linode.com/v4", "test-token")
@@ -128,7 +125,6 @@ def test_create_linode_domain_import_tool_schema() -> None:
     assert tool.input_schema["properties"]["dry_run"]["type"] == "boolean"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_domain_import_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -161,7 +157,6 @@ async def test_handle_linode_domain_import_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_domain_import_dry_run_requires_confirm_and_skips_client(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -186,7 +181,6 @@ async def test_handle_linode_domain_import_dry_run_requires_confirm_and_skips_cl
     mock_linode_client.import_domain.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "confirm_value",
     [None, False, "true", 1],
@@ -208,7 +202,6 @@ async def test_handle_linode_domain_import_rejects_non_true_confirm(
     mock_linode_client.import_domain.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -255,7 +248,6 @@ async def test_handle_linode_domain_import_rejects_invalid_body_fields(
     mock_linode_client.import_domain.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_domain_import_reports_client_errors(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
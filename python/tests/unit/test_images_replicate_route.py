@@ -39,7 +39,6 @@ class _CapturingRetryableClient(RetryableClient):
         return await func(*args)
 
 
-@pytest.mark.asyncio
 async def test_client_replicate_image_sends_exact_path_and_body() -> None:
     """Low-level client sends POST /images/{imageId}/regions."""
     seen: list[httpx.Request] = []
@@ -71,7 +70,6 @@ async def test_client_replicate_image_sends_exact_path_and_body() -> None:
     }
 
 
-@pytest.mark.asyncio
 async def test_client_replicate_image_escapes_image_id() -> None:
     """Low-level client URL-encodes untrusted image IDs at the path boundary."""
     seen: list[httpx.Request] = []
@@ -91,7 +89,6 @@ async def test_client_replicate_image_escapes_image_id() -> None:
     assert seen[0].url.raw_path == b"/v4/images/private%2F123%3Fbad/regions"
 
 
-@pytest.mark.asyncio
 async def test_client_replicate_image_maps_http_error() -> None:
     """Low-level client maps HTTP errors to NetworkError."""
 
@@ -108,7 +105,6 @@ async def test_client_replicate_image_maps_http_error() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_replicate_image_delegates_once() -> None:
     """Mutating replicate-image requests are not replayed by retry logic."""
     retryable = _CapturingRetryableClient()
@@ -142,7 +138,6 @@ def test_create_linode_image_replicate_tool_schema() -> None:
     assert schema["properties"]["dry_run"]["type"] == "boolean"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_image_replicate_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -181,7 +176,6 @@ async def test_handle_linode_image_replicate_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm_value", [None, False, "true", 1])
 async def test_handle_linode_image_replicate_requires_literal_confirm(
     confirm_value: Any, sample_config: Any, mock_linode_client: AsyncMock
@@ -200,7 +194,6 @@ async def test_handle_linode_image_replicate_requires_literal_confirm(
     mock_linode_client.replicate_image.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("arguments", "message"),
     [
@@ -251,7 +244,6 @@ async def test_handle_linode_image_replicate_rejects_invalid_inputs(
     mock_linode_client.replicate_image.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_image_replicate_dry_run(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -277,7 +269,6 @@ async def test_handle_linode_image_replicate_dry_run(
     mock_linode_client.replicate_image.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_image_replicate_reports_client_errors(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -89,7 +89,6 @@ class _CapturingRetryableClient(RetryableClient):
         return await func(*args)
 
 
-@pytest.mark.asyncio
 async def test_client_list_image_sharegroups_by_image_sends_exact_path() -> None:
     """Low-level client sends GET /images/{imageId}/sharegroups."""
     seen: list[httpx.Request] = []
@@ -124,7 +123,6 @@ async def test_client_list_image_sharegroups_by_image_sends_exact_path() -> None
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("image_id", "expected_raw_path"),
     [
@@ -157,7 +155,6 @@ async def test_client_list_image_sharegroups_by_image_encodes_path_param(
     assert seen[0].url.raw_path == expected_raw_path
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "image_id", ["", " ", 12345, ["linode/ubuntu"], "linode/..", "linode/ubuntu?x=1"]
 )
@@ -180,7 +177,6 @@ async def test_client_list_image_sharegroups_by_image_rejects_malformed_path_par
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_client_list_image_sharegroups_sends_exact_path_and_query() -> None:
     """Low-level client sends GET /images/sharegroups with pagination."""
     seen: list[httpx.Request] = []
@@ -214,7 +210,6 @@ async def test_client_list_image_sharegroups_sends_exact_path_and_query() -> Non
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_delete_image_sharegroup_member_token_accepts_no_content() -> None:
     """Low-level client accepts 204 No Content delete responses."""
     seen: list[httpx.Request] = []
@@ -237,7 +232,6 @@ async def test_client_delete_image_sharegroup_member_token_accepts_no_content()
     assert len(seen) == 1
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("kwargs", "message"),
     [
@@ -273,7 +267,6 @@ async def test_client_list_image_sharegroups_validates_pagination_before_request
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_retryable_list_image_sharegroups_by_image_uses_retry() -> None:
     """Read-only image share groups by image list goes through retry wrapper."""
     retryable = _CapturingRetryableClient()
@@ -292,7 +285,6 @@ async def test_retryable_list_image_sharegroups_by_image_uses_retry() -> None:
     mock_list.assert_awaited_once_with("private/12345", page=None, page_size=None)
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_list_image_sharegroups_uses_read_retry() -> None:
     """Read-only image share groups list goes through the retry wrapper."""
     retryable = _CapturingRetryableClient()
@@ -321,7 +313,6 @@ def test_create_linode_image_sharegroups_by_image_list_tool_schema() -> None:
     assert tool.input_schema["properties"]["image_id"]["type"] == "string"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_image_sharegroups_by_image_list_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -367,7 +358,6 @@ async def test_handle_linode_image_sharegroups_by_image_list_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "image_id",
     [
@@ -392,7 +382,6 @@ async def test_handle_linode_image_sharegroups_by_image_list_rejects_bad_image_i
     mock_linode_client.list_image_sharegroups_by_image.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -441,7 +430,6 @@ def test_create_linode_images_sharegroups_list_tool_schema() -> None:
     assert tool.input_schema["properties"]["page_size"]["type"] == "integer"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroups_list_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -487,7 +475,6 @@ async def test_handle_linode_images_sharegroups_list_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -527,7 +514,6 @@ def test_linode_images_sharegroups_list_scopes_to_images_read() -> None:
     assert scopes == [Scope.ImagesReadOnly]
 
 
-@pytest.mark.asyncio
 async def test_client_create_image_sharegroup_sends_exact_body() -> None:
     """Low-level client sends POST /images/sharegroups with documented body."""
     seen: list[httpx.Request] = []
@@ -584,7 +570,6 @@ async def test_client_create_image_sharegroup_sends_exact_body() -> None:
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_create_image_sharegroup_maps_http_error() -> None:
     """Low-level client maps HTTP errors to a NetworkError."""
 
@@ -601,7 +586,6 @@ async def test_client_create_image_sharegroup_maps_http_error() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_create_image_sharegroup_does_not_retry() -> None:
     """Mutating image share group create delegates once without retry replay."""
     retryable = _CapturingRetryableClient()
@@ -620,7 +604,6 @@ async def test_retryable_client_create_image_sharegroup_does_not_retry() -> None
     )
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_update_image_sharegroup_delegates_once() -> None:
     """Mutating image share group update delegates once without retry replay."""
     retryable = _CapturingRetryableClient()
@@ -637,7 +620,6 @@ async def test_retryable_client_update_image_sharegroup_delegates_once() -> None
     mock_update.assert_awaited_once_with("7", label="renamed", description=None)
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_update_image_sharegroup_requires_a_field() -> None:
     """Update without label or description raises before the client call."""
     retryable = _CapturingRetryableClient()
@@ -653,7 +635,6 @@ async def test_retryable_client_update_image_sharegroup_requires_a_field() -> No
     mock_update.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_client_update_image_sharegroup_maps_http_error() -> None:
     """Low-level client maps HTTP failures on update to a NetworkError."""
 
@@ -670,7 +651,6 @@ async def test_client_update_image_sharegroup_maps_http_error() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_create_image_sharegroup_token_delegates_once() -> None:
     """Mutating token create delegates once without retry replay."""
     retryable = _CapturingRetryableClient()
@@ -711,7 +691,6 @@ def test_create_linode_image_sharegroup_create_tool_schema() -> None:
     assert schema["properties"]["dry_run"]["type"] == "boolean"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_image_sharegroup_create_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -752,7 +731,6 @@ async def test_handle_linode_image_sharegroup_create_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm_value", [None, False, "true", 1])
 async def test_handle_linode_image_sharegroup_create_requires_literal_confirm(
     confirm_value: Any, sample_config: Any, mock_linode_client: AsyncMock
@@ -809,7 +787,6 @@ IMAGE_SHAREGROUP_CREATE_INVALID_PAYLOAD_CASES: list[tuple[dict[str, Any], str]]
 ]
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("arguments", "message"), IMAGE_SHAREGROUP_CREATE_INVALID_PAYLOAD_CASES
 )
@@ -826,7 +803,6 @@ async def test_handle_linode_image_sharegroup_create_rejects_invalid_payload(
     mock_linode_client.create_image_sharegroup.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_image_sharegroup_create_dry_run(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -874,7 +850,6 @@ def test_linode_image_sharegroup_create_scopes_to_images_write() -> None:
     assert scopes == [Scope.ImagesReadWrite]
 
 
-@pytest.mark.asyncio
 async def test_client_list_image_sharegroup_tokens_sends_exact_path() -> None:
     """Low-level client sends GET /images/sharegroups/tokens with no query/body."""
     seen: list[httpx.Request] = []
@@ -914,7 +889,6 @@ async def test_client_list_image_sharegroup_tokens_sends_exact_path() -> None:
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_list_image_sharegroup_tokens_uses_read_retry() -> None:
     """Read-only image share group tokens list goes through the retry wrapper."""
     retryable = _CapturingRetryableClient()
@@ -933,7 +907,6 @@ async def test_retryable_client_list_image_sharegroup_tokens_uses_read_retry() -
     mock_list.assert_awaited_once_with(page=None, page_size=None)
 
 
-@pytest.mark.asyncio
 async def test_client_get_image_sharegroup_token_sends_exact_encoded_path() -> None:
     """Low-level client sends GET /images/sharegroups/tokens/{tokenUuid}."""
     seen: list[httpx.Request] = []
@@ -968,7 +941,6 @@ async def test_client_get_image_sharegroup_token_sends_exact_encoded_path() -> N
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_get_image_sharegroup_token_encodes_path_param() -> None:
     """Low-level client URL-encodes token_uuid at the path boundary."""
     seen: list[httpx.Request] = []
@@ -990,7 +962,6 @@ async def test_client_get_image_sharegroup_token_encodes_path_param() -> None:
     )
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_get_image_sharegroup_token_uses_read_retry() -> None:
     """Read-only image share group token get goes through the retry wrapper."""
     retryable = _CapturingRetryableClient()
@@ -1018,7 +989,6 @@ def test_create_linode_images_sharegroups_token_get_tool_schema() -> None:
     assert tool.input_schema["required"] == ["token_uuid"]
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroups_token_get_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1043,7 +1013,6 @@ async def test_handle_linode_images_sharegroups_token_get_success(
     mock_linode_client.get_image_sharegroup_token.assert_awaited_once_with(token_uuid)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -1089,7 +1058,6 @@ def test_linode_images_sharegroups_token_get_in_version_features() -> None:
     assert "linode_image_sharegroup_token_get" in FEATURE_TOOLS_LIST.split(",")
 
 
-@pytest.mark.asyncio
 async def test_client_get_image_sharegroup_by_token_sends_exact_encoded_path() -> None:
     """Low-level client sends GET /images/sharegroups/tokens/{tokenUuid}/sharegroup."""
     seen: list[httpx.Request] = []
@@ -1120,7 +1088,6 @@ async def test_client_get_image_sharegroup_by_token_sends_exact_encoded_path() -
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_get_image_sharegroup_by_token_encodes_path_param() -> None:
     """Low-level client URL-encodes token_uuid before appending /sharegroup."""
     seen: list[httpx.Request] = []
@@ -1142,7 +1109,6 @@ async def test_client_get_image_sharegroup_by_token_encodes_path_param() -> None
     )
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_get_image_sharegroup_by_token_uses_read_retry() -> None:
     """Read-only share group by token get goes through the retry wrapper."""
     retryable = _CapturingRetryableClient()
@@ -1170,7 +1136,6 @@ def test_create_linode_images_sharegroups_token_sharegroup_get_tool_schema() ->
     assert tool.input_schema["required"] == ["token_uuid"]
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroups_token_sharegroup_get_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1195,7 +1160,6 @@ async def test_handle_linode_images_sharegroups_token_sharegroup_get_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -1240,7 +1204,6 @@ def test_linode_images_sharegroups_token_sharegroup_get_in_version_features() ->
     assert "linode_image_sharegroup_by_token_get" in FEATURE_TOOLS_LIST.split(",")
 
 
-@pytest.mark.asyncio
 async def test_client_list_images_by_token_sends_exact_encoded_path() -> None:
     """Low-level client sends GET images-by-token route."""
     seen: list[httpx.Request] = []
@@ -1278,7 +1241,6 @@ async def test_client_list_images_by_token_sends_exact_encoded_path() -> None:
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_list_images_by_token_encodes_path_param() -> None:
     """Low-level client URL-encodes token_uuid before appending /sharegroup/images."""
     seen: list[httpx.Request] = []
@@ -1300,7 +1262,6 @@ async def test_client_list_images_by_token_encodes_path_param() -> None:
     )
 
 
-@pytest.mark.asyncio
 async def test_retryable_list_images_by_token_uses_read_retry() -> None:
     """Read-only images by token list goes through the retry wrapper."""
     retryable = _CapturingRetryableClient()
@@ -1333,7 +1294,6 @@ def test_create_token_sharegroup_images_list_tool_schema() -> None:
     assert tool.input_schema["required"] == ["token_uuid"]
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroups_token_sharegroup_images_list_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1376,7 +1336,6 @@ async def test_handle_linode_images_sharegroups_token_sharegroup_images_list_suc
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -1427,7 +1386,6 @@ def test_token_sharegroup_images_list_in_version_features() -> None:
     assert "linode_image_sharegroup_token_image_list" in features
 
 
-@pytest.mark.asyncio
 async def test_client_list_image_sharegroup_members_sends_exact_encoded_path() -> None:
     """Low-level client sends GET /images/sharegroups/{sharegroupId}/members."""
     seen: list[httpx.Request] = []
@@ -1463,7 +1421,6 @@ async def test_client_list_image_sharegroup_members_sends_exact_encoded_path() -
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_list_image_sharegroup_members_encodes_path_param() -> None:
     """Low-level client URL-encodes sharegroup_id before appending /members."""
     seen: list[httpx.Request] = []
@@ -1485,7 +1442,6 @@ async def test_client_list_image_sharegroup_members_encodes_path_param() -> None
     )
 
 
-@pytest.mark.asyncio
 async def test_client_list_image_sharegroup_members_maps_http_error() -> None:
     """Low-level client maps HTTP failures to NetworkError."""
 
@@ -1504,7 +1460,6 @@ async def test_client_list_image_sharegroup_members_maps_http_error() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_list_image_sharegroup_members_uses_read_retry() -> None:
     """Read-only members by share group list goes through the retry wrapper."""
     retryable = _CapturingRetryableClient()
@@ -1539,7 +1494,6 @@ def test_create_linode_images_sharegroup_members_list_tool_schema() -> None:
     assert sharegroup_id_schema["type"] == "integer"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_members_list_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1580,7 +1534,6 @@ async def test_handle_linode_images_sharegroup_members_list_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_members_list_defaults_missing_pagination(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1602,7 +1555,6 @@ async def test_handle_linode_images_sharegroup_members_list_defaults_missing_pag
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -1647,7 +1599,6 @@ def test_linode_images_sharegroup_members_list_in_version_features() -> None:
     assert "linode_image_sharegroup_member_list" in FEATURE_TOOLS_LIST.split(",")
 
 
-@pytest.mark.asyncio
 async def test_client_get_image_sharegroup_member_token_sends_exact_encoded_path() -> (
     None
 ):
@@ -1689,7 +1640,6 @@ async def test_client_get_image_sharegroup_member_token_sends_exact_encoded_path
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_get_image_sharegroup_member_token_encodes_path_params() -> None:
     """Low-level client URL-encodes both path params at the boundary."""
     seen: list[httpx.Request] = []
@@ -1714,7 +1664,6 @@ async def test_client_get_image_sharegroup_member_token_encodes_path_params() ->
     )
 
 
-@pytest.mark.asyncio
 async def test_client_get_image_sharegroup_member_token_maps_http_error() -> None:
     """Low-level client maps HTTP failures to NetworkError."""
 
@@ -1734,7 +1683,6 @@ async def test_client_get_image_sharegroup_member_token_maps_http_error() -> Non
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_get_image_sharegroup_member_token_uses_read_retry() -> None:
     """Read-only member token get goes through the retry wrapper."""
     retryable = _CapturingRetryableClient()
@@ -1773,7 +1721,6 @@ def test_create_linode_images_sharegroup_member_token_get_tool_schema() -> None:
     assert token_schema["type"] == "string"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_member_token_get_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1803,7 +1750,6 @@ async def test_handle_linode_images_sharegroup_member_token_get_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("sharegroup_id", "token_uuid"),
     [
@@ -1859,7 +1805,6 @@ def test_linode_images_sharegroup_member_token_get_in_version_features() -> None
     assert "linode_image_sharegroup_member_token_get" in FEATURE_TOOLS_LIST.split(",")
 
 
-@pytest.mark.asyncio
 async def test_client_update_image_sharegroup_member_token_sends_exact_path_body() -> (
     None
 ):
@@ -1901,7 +1846,6 @@ async def test_client_update_image_sharegroup_member_token_sends_exact_path_body
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_update_image_sharegroup_member_token_encodes_path_params() -> (
     None
 ):
@@ -1928,7 +1872,6 @@ async def test_client_update_image_sharegroup_member_token_encodes_path_params()
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("bad_label", ["", "   "])
 async def test_client_update_image_sharegroup_member_token_rejects_blank_label(
     bad_label: str,
@@ -1957,7 +1900,6 @@ async def test_client_update_image_sharegroup_member_token_rejects_blank_label(
     assert calls == 0
 
 
-@pytest.mark.asyncio
 async def test_client_update_image_sharegroup_member_token_maps_http_error() -> None:
     """Low-level client maps HTTP failures to NetworkError."""
 
@@ -1978,7 +1920,6 @@ async def test_client_update_image_sharegroup_member_token_maps_http_error() ->
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_member_token_update_delegates_once() -> None:
     """Retryable update wrapper should not replay member token updates after errors."""
     retryable = RetryableClient("https://api.linode.com/v4", "test-token")
@@ -2020,7 +1961,6 @@ def test_create_linode_images_sharegroup_member_token_update_tool_schema() -> No
     assert tool.input_schema["properties"]["token_uuid"]["type"] == "string"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_member_token_update_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -2060,7 +2000,6 @@ async def test_handle_linode_images_sharegroup_member_token_update_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("bad_confirm", [None, False, "true", 1])
 async def test_member_token_update_requires_true_confirm(
     bad_confirm: object, sample_config: Any, mock_linode_client: AsyncMock
@@ -2083,7 +2022,6 @@ async def test_member_token_update_requires_true_confirm(
     mock_linode_client.update_image_sharegroup_member_token.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("sharegroup_id", "token_uuid"),
     [
@@ -2121,7 +2059,6 @@ async def test_member_token_update_rejects_invalid_path_params(
     mock_linode_client.update_image_sharegroup_member_token.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("bad_label", [None, "", "   ", 123, True])
 async def test_member_token_update_rejects_invalid_label(
     bad_label: object, sample_config: Any, mock_linode_client: AsyncMock
@@ -2142,7 +2079,6 @@ async def test_member_token_update_rejects_invalid_label(
     mock_linode_client.update_image_sharegroup_member_token.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_image_sharegroup_member_token_update_dry_run_previews_without_confirm(
     sample_config: Any,
 ) -> None:
@@ -2160,7 +2096,6 @@ async def test_image_sharegroup_member_token_update_dry_run_previews_without_con
     assert '"dry_run": true' in result[0].text
 
 
-@pytest.mark.asyncio
 async def test_image_sharegroup_member_token_update_dry_run_returns_encoded_preview(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -2216,7 +2151,6 @@ def test_linode_images_sharegroup_member_token_update_in_version_features() -> N
     )
 
 
-@pytest.mark.asyncio
 async def test_client_delete_image_sharegroup_member_token_sends_exact_path() -> None:
     """Low-level client sends DELETE /images/sharegroups/{id}/members/{tokenUuid}."""
     seen: list[httpx.Request] = []
@@ -2246,7 +2180,6 @@ async def test_client_delete_image_sharegroup_member_token_sends_exact_path() ->
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_delete_image_sharegroup_member_token_encodes_path_params() -> (
     None
 ):
@@ -2273,7 +2206,6 @@ async def test_client_delete_image_sharegroup_member_token_encodes_path_params()
     )
 
 
-@pytest.mark.asyncio
 async def test_client_delete_image_sharegroup_member_token_maps_http_error() -> None:
     """Low-level client maps httpx transport failures to NetworkError."""
 
@@ -2293,7 +2225,6 @@ async def test_client_delete_image_sharegroup_member_token_maps_http_error() ->
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_member_token_delete_delegates_once() -> None:
     """Destructive member token revoke should not replay mapped client errors."""
     retryable = RetryableClient("https://api.linode.com/v4", "test-token")
@@ -2335,7 +2266,6 @@ def test_create_linode_images_sharegroup_member_token_delete_tool_schema() -> No
     assert tool.input_schema["properties"]["token_uuid"]["type"] == "string"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_member_token_delete_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -2363,7 +2293,6 @@ async def test_handle_linode_images_sharegroup_member_token_delete_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("bad_confirm", [None, False, "true", 1])
 async def test_member_token_delete_requires_true_confirm(
     bad_confirm: object, sample_config: Any, mock_linode_client: AsyncMock
@@ -2385,7 +2314,6 @@ async def test_member_token_delete_requires_true_confirm(
     mock_linode_client.delete_image_sharegroup_member_token.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("sharegroup_id", "token_uuid"),
     [
@@ -2422,7 +2350,6 @@ async def test_member_token_delete_rejects_invalid_path_params(
     mock_linode_client.delete_image_sharegroup_member_token.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_image_sharegroup_member_token_delete_dry_run_previews_without_confirm(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -2443,7 +2370,6 @@ async def test_image_sharegroup_member_token_delete_dry_run_previews_without_con
     assert '"dry_run": true' in result[0].text
 
 
-@pytest.mark.asyncio
 async def test_image_sharegroup_member_token_delete_dry_run_returns_encoded_preview(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -2501,7 +2427,6 @@ def test_linode_images_sharegroup_member_token_delete_in_version_features() -> N
     )
 
 
-@pytest.mark.asyncio
 async def test_client_list_image_sharegroup_images_sends_exact_encoded_path() -> None:
     """Low-level client sends GET /images/sharegroups/{sharegroupId}/images."""
     seen: list[httpx.Request] = []
@@ -2537,7 +2462,6 @@ async def test_client_list_image_sharegroup_images_sends_exact_encoded_path() ->
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_list_image_sharegroup_images_encodes_path_param() -> None:
     """Low-level client URL-encodes sharegroup_id before appending /images."""
     seen: list[httpx.Request] = []
@@ -2559,7 +2483,6 @@ async def test_client_list_image_sharegroup_images_encodes_path_param() -> None:
     )
 
 
-@pytest.mark.asyncio
 async def test_retryable_list_image_sharegroup_images_uses_read_retry() -> None:
     """Read-only images by share group list goes through the retry wrapper."""
     retryable = _CapturingRetryableClient()
@@ -2577,7 +2500,6 @@ async def test_retryable_list_image_sharegroup_images_uses_read_retry() -> None:
     mock_list.assert_awaited_once_with(sharegroup_id, page=None, page_size=None)
 
 
-@pytest.mark.asyncio
 async def test_client_delete_image_sharegroup_image_sends_exact_path() -> None:
     """Low-level client sends DELETE to the documented share-group image path."""
     seen: list[httpx.Request] = []
@@ -2603,7 +2525,6 @@ async def test_client_delete_image_sharegroup_image_sends_exact_path() -> None:
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_delete_image_sharegroup_image_encodes_path_params() -> None:
     """Low-level client URL-encodes both path params at the boundary."""
     seen: list[httpx.Request] = []
@@ -2625,7 +2546,6 @@ async def test_client_delete_image_sharegroup_image_encodes_path_params() -> Non
     )
 
 
-@pytest.mark.asyncio
 async def test_client_delete_image_sharegroup_image_maps_http_error() -> None:
     """Low-level client maps HTTP failures to NetworkError."""
 
@@ -2642,7 +2562,6 @@ async def test_client_delete_image_sharegroup_image_maps_http_error() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_delete_image_sharegroup_image_delegates_once() -> None:
     """Destructive image revocation delegates once without retry replay."""
     retryable = _CapturingRetryableClient()
@@ -2672,7 +2591,6 @@ def test_create_linode_images_sharegroup_image_delete_tool_schema() -> None:
     assert schema["properties"]["dry_run"]["type"] == "boolean"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_image_delete_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -2690,7 +2608,6 @@ async def test_handle_linode_images_sharegroup_image_delete_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm", [None, False, "true", 1])
 async def test_handle_linode_images_sharegroup_image_delete_rejects_non_true_confirm(
     sample_config: Any, mock_linode_client: AsyncMock, confirm: object
@@ -2706,7 +2623,6 @@ async def test_handle_linode_images_sharegroup_image_delete_rejects_non_true_con
     mock_linode_client.delete_image_sharegroup_image.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("arguments", "expected_error"),
     [
@@ -2757,7 +2673,6 @@ async def test_handle_linode_images_sharegroup_image_delete_rejects_invalid_path
     mock_linode_client.delete_image_sharegroup_image.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_image_delete_dry_run(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -2802,7 +2717,6 @@ def test_linode_images_sharegroup_image_delete_in_version_features() -> None:
     assert "linode_image_sharegroup_image_delete" in FEATURE_TOOLS_LIST.split(",")
 
 
-@pytest.mark.asyncio
 async def test_client_add_image_sharegroup_images_sends_exact_path_and_body() -> None:
     """Low-level client sends POST /images/sharegroups/{sharegroupId}/images."""
     seen: list[httpx.Request] = []
@@ -2833,7 +2747,6 @@ async def test_client_add_image_sharegroup_images_sends_exact_path_and_body() ->
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_add_image_sharegroup_images_encodes_path_param() -> None:
     """Low-level client URL-encodes sharegroup_id before appending /images."""
     seen: list[httpx.Request] = []
@@ -2857,7 +2770,6 @@ async def test_client_add_image_sharegroup_images_encodes_path_param() -> None:
     )
 
 
-@pytest.mark.asyncio
 async def test_client_add_image_sharegroup_images_rejects_empty_images() -> None:
     """Low-level client rejects an empty required body before the request."""
     called = False
@@ -2881,7 +2793,6 @@ async def test_client_add_image_sharegroup_images_rejects_empty_images() -> None
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_add_image_sharegroup_images_maps_http_error() -> None:
     """Low-level client maps HTTP transport failures."""
 
@@ -2901,7 +2812,6 @@ async def test_client_add_image_sharegroup_images_maps_http_error() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_add_image_sharegroup_images_delegates_once() -> None:
     """Mutating add-images route delegates once without retry replay."""
     retryable = _CapturingRetryableClient()
@@ -2940,7 +2850,6 @@ def test_create_linode_images_sharegroup_images_add_tool_schema() -> None:
     assert tool.input_schema["properties"]["sharegroup_id"]["type"] == "integer"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_images_add_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -2984,7 +2893,6 @@ async def test_handle_linode_images_sharegroup_images_add_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm", [None, False, "true", 1])
 async def test_handle_linode_images_sharegroup_images_add_requires_literal_confirm(
     confirm: object, sample_config: Any, mock_linode_client: AsyncMock
@@ -3003,7 +2911,6 @@ async def test_handle_linode_images_sharegroup_images_add_requires_literal_confi
     mock_linode_client.add_image_sharegroup_images.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -3028,7 +2935,6 @@ async def test_handle_linode_images_sharegroup_images_add_rejects_invalid_uuid(
     mock_linode_client.add_image_sharegroup_images.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("images", "message"), INVALID_ADD_IMAGE_SHAREGROUP_IMAGES_CASES
 )
@@ -3049,7 +2955,6 @@ async def test_handle_linode_images_sharegroup_images_add_rejects_invalid_body(
     mock_linode_client.add_image_sharegroup_images.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_images_add_dry_run(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -3099,7 +3004,6 @@ def test_linode_images_sharegroup_images_add_in_version_features() -> None:
     assert "linode_image_sharegroup_image_add" in FEATURE_TOOLS_LIST.split(",")
 
 
-@pytest.mark.asyncio
 async def test_client_add_members_exact_path_and_body() -> None:
     """Low-level client sends POST /images/sharegroups/{sharegroupId}/members."""
     seen: list[httpx.Request] = []
@@ -3131,7 +3035,6 @@ async def test_client_add_members_exact_path_and_body() -> None:
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_add_members_to_image_sharegroup_encodes_path_param() -> None:
     """Low-level client URL-encodes sharegroup_id before appending /members."""
     seen: list[httpx.Request] = []
@@ -3155,7 +3058,6 @@ async def test_client_add_members_to_image_sharegroup_encodes_path_param() -> No
     )
 
 
-@pytest.mark.asyncio
 async def test_client_add_members_rejects_empty_body_fields() -> None:
     """Low-level client rejects empty required body fields before the request."""
     called = False
@@ -3183,7 +3085,6 @@ async def test_client_add_members_rejects_empty_body_fields() -> None:
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_add_members_to_image_sharegroup_maps_http_error() -> None:
     """Low-level client maps HTTP transport failures."""
 
@@ -3204,7 +3105,6 @@ async def test_client_add_members_to_image_sharegroup_maps_http_error() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_add_members_to_image_sharegroup_delegates_once() -> None:
     """Mutating add-members route delegates once without retry replay."""
     retryable = _CapturingRetryableClient()
@@ -3250,7 +3150,6 @@ def test_create_linode_images_sharegroup_members_add_tool_schema() -> None:
     assert sharegroup_schema["type"] == "integer"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_members_add_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -3290,7 +3189,6 @@ async def test_handle_linode_images_sharegroup_members_add_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm", [None, False, "true", 1])
 async def test_handle_linode_images_sharegroup_members_add_requires_literal_confirm(
     confirm: object, sample_config: Any, mock_linode_client: AsyncMock
@@ -3310,7 +3208,6 @@ async def test_handle_linode_images_sharegroup_members_add_requires_literal_conf
     mock_linode_client.add_members_to_image_sharegroup.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -3340,7 +3237,6 @@ async def test_handle_linode_images_sharegroup_members_add_rejects_invalid_uuid(
     mock_linode_client.add_members_to_image_sharegroup.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("arguments", "message"),
     [
@@ -3372,7 +3268,6 @@ async def test_handle_linode_images_sharegroup_members_add_rejects_invalid_body(
     mock_linode_client.add_members_to_image_sharegroup.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_members_add_dry_run(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -3442,7 +3337,6 @@ def test_create_linode_images_sharegroup_images_list_tool_schema() -> None:
     assert sharegroup_id_schema["type"] == "integer"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_images_list_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -3485,7 +3379,6 @@ async def test_handle_linode_images_sharegroup_images_list_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("pagination", "message"),
     [
@@ -3511,7 +3404,6 @@ async def test_handle_linode_images_sharegroup_images_list_rejects_bad_paginatio
     mock_linode_client.list_image_sharegroup_images.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("pagination", "message"),
     [
@@ -3540,7 +3432,6 @@ async def test_handle_linode_images_token_images_list_rejects_bad_pagination(
     mock_linode_client.list_image_sharegroup_images_by_token.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("pagination", "message"),
     [
@@ -3566,7 +3457,6 @@ async def test_handle_linode_images_by_image_list_rejects_bad_pagination(
     mock_linode_client.list_image_sharegroups_by_image.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -3611,7 +3501,6 @@ def test_linode_images_sharegroup_images_list_in_version_features() -> None:
     assert "linode_image_sharegroup_image_list" in FEATURE_TOOLS_LIST.split(",")
 
 
-@pytest.mark.asyncio
 async def test_client_update_image_sharegroup_token_sends_exact_path_and_body() -> None:
     """Low-level client sends PUT /images/sharegroups/tokens/{tokenUuid}."""
     seen: list[httpx.Request] = []
@@ -3648,7 +3537,6 @@ async def test_client_update_image_sharegroup_token_sends_exact_path_and_body()
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_update_image_sharegroup_token_encodes_path_param() -> None:
     """Low-level client URL-encodes token_uuid at the path boundary."""
     seen: list[httpx.Request] = []
@@ -3672,7 +3560,6 @@ async def test_client_update_image_sharegroup_token_encodes_path_param() -> None
     )
 
 
-@pytest.mark.asyncio
 async def test_client_create_image_sharegroup_token_maps_http_error() -> None:
     """Low-level client maps HTTP failures on token create to a NetworkError."""
 
@@ -3692,7 +3579,6 @@ async def test_client_create_image_sharegroup_token_maps_http_error() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_client_update_image_sharegroup_token_maps_http_error() -> None:
     """Low-level client maps HTTP failures on token update to a NetworkError."""
 
@@ -3712,7 +3598,6 @@ async def test_client_update_image_sharegroup_token_maps_http_error() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_update_image_sharegroup_token_delegates_once() -> None:
     """Retryable update wrapper should not replay token updates after errors."""
     retryable = RetryableClient("https://api.linode.com/v4", "test-token")
@@ -3745,7 +3630,6 @@ def test_create_linode_images_sharegroups_token_update_tool_schema() -> None:
     assert tool.input_schema["properties"]["dry_run"]["type"] == "boolean"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroups_token_update_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -3781,7 +3665,6 @@ async def test_handle_linode_images_sharegroups_token_update_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("bad_confirm", [None, False, "true", 1])
 async def test_handle_linode_images_sharegroups_token_update_requires_true_confirm(
     bad_confirm: object, sample_config: Any, mock_linode_client: AsyncMock
@@ -3801,7 +3684,6 @@ async def test_handle_linode_images_sharegroups_token_update_requires_true_confi
     mock_linode_client.update_image_sharegroup_token.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "bad_uuid",
     [
@@ -3826,7 +3708,6 @@ async def test_handle_linode_images_sharegroups_token_update_rejects_invalid_tok
     mock_linode_client.update_image_sharegroup_token.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("bad_label", [None, "", "   ", 123, True])
 async def test_handle_linode_images_sharegroups_token_update_rejects_invalid_label(
     bad_label: object, sample_config: Any, mock_linode_client: AsyncMock
@@ -3846,7 +3727,6 @@ async def test_handle_linode_images_sharegroups_token_update_rejects_invalid_lab
     mock_linode_client.update_image_sharegroup_token.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_image_sharegroup_token_update_dry_run_previews_without_confirm(
     sample_config: Any,
 ) -> None:
@@ -3863,7 +3743,6 @@ async def test_image_sharegroup_token_update_dry_run_previews_without_confirm(
     assert '"dry_run": true' in result[0].text
 
 
-@pytest.mark.asyncio
 async def test_image_sharegroup_token_update_dry_run_returns_encoded_preview(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -3911,7 +3790,6 @@ def test_linode_images_sharegroups_token_update_in_version_features() -> None:
     assert "linode_image_sharegroup_token_update" in FEATURE_TOOLS_LIST.split(",")
 
 
-@pytest.mark.asyncio
 async def test_client_delete_image_sharegroup_token_sends_exact_path() -> None:
     """Low-level client sends DELETE /images/sharegroups/tokens/{tokenUuid}."""
     seen: list[httpx.Request] = []
@@ -3938,7 +3816,6 @@ async def test_client_delete_image_sharegroup_token_sends_exact_path() -> None:
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_delete_image_sharegroup_token_encodes_path_param() -> None:
     """Low-level client URL-encodes token_uuid at the path boundary."""
     seen: list[httpx.Request] = []
@@ -3960,7 +3837,6 @@ async def test_client_delete_image_sharegroup_token_encodes_path_param() -> None
     )
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_delete_image_sharegroup_token_delegates_once() -> None:
     """Retryable delete wrapper should not replay deletes after errors."""
     retryable = RetryableClient("https://api.linode.com/v4", "test-token")
@@ -3991,7 +3867,6 @@ def test_create_linode_images_sharegroups_token_delete_tool_schema() -> None:
     assert tool.input_schema["properties"]["dry_run"]["type"] == "boolean"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroups_token_delete_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -4009,7 +3884,6 @@ async def test_handle_linode_images_sharegroups_token_delete_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("bad_confirm", [None, False, "true", 1])
 async def test_handle_linode_images_sharegroups_token_delete_requires_true_confirm(
     bad_confirm: object, sample_config: Any, mock_linode_client: AsyncMock
@@ -4028,7 +3902,6 @@ async def test_handle_linode_images_sharegroups_token_delete_requires_true_confi
     mock_linode_client.delete_image_sharegroup_token.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "bad_uuid",
     [
@@ -4053,7 +3926,6 @@ async def test_handle_linode_images_sharegroups_token_delete_rejects_invalid_tok
     mock_linode_client.delete_image_sharegroup_token.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_image_sharegroup_token_delete_dry_run_previews_without_confirm(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -4073,7 +3945,6 @@ async def test_image_sharegroup_token_delete_dry_run_previews_without_confirm(
     assert '"dry_run": true' in result[0].text
 
 
-@pytest.mark.asyncio
 async def test_image_sharegroup_token_delete_dry_run_returns_encoded_preview(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -4137,7 +4008,6 @@ def test_create_linode_images_sharegroups_tokens_list_tool_schema() -> None:
     assert "required" not in tool.input_schema
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroups_tokens_list_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -4205,7 +4075,6 @@ def test_linode_images_sharegroups_tokens_list_in_version_features() -> None:
     assert "linode_image_sharegroup_token_list" in FEATURE_TOOLS_LIST.split(",")
 
 
-@pytest.mark.asyncio
 async def test_client_update_image_sharegroup_image_sends_exact_path_and_body() -> None:
     """Low-level client sends PUT to the documented shared-image route."""
     seen: list[httpx.Request] = []
@@ -4237,7 +4106,6 @@ async def test_client_update_image_sharegroup_image_sends_exact_path_and_body()
     }
 
 
-@pytest.mark.asyncio
 async def test_client_update_image_sharegroup_image_encodes_path_params() -> None:
     """Low-level client URL-encodes both path params at the boundary."""
     seen: list[httpx.Request] = []
@@ -4262,7 +4130,6 @@ async def test_client_update_image_sharegroup_image_encodes_path_params() -> Non
     )
 
 
-@pytest.mark.asyncio
 async def test_client_update_image_sharegroup_image_rejects_empty_body() -> None:
     """Empty update bodies are rejected before HTTP."""
     called = False
@@ -4286,7 +4153,6 @@ async def test_client_update_image_sharegroup_image_rejects_empty_body() -> None
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_update_image_sharegroup_image_rejects_empty_strings() -> None:
     """Low-level client rejects weak body fields before HTTP."""
     called = False
@@ -4310,7 +4176,6 @@ async def test_client_update_image_sharegroup_image_rejects_empty_strings() -> N
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_update_image_sharegroup_image_wraps_http_errors() -> None:
     """HTTP transport failures are mapped to route-specific NetworkError."""
 
@@ -4327,7 +4192,6 @@ async def test_client_update_image_sharegroup_image_wraps_http_errors() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_update_image_sharegroup_image_delegates_once() -> None:
     """Mutating shared-image update does not use generic retry replay."""
     retryable = _CapturingRetryableClient()
@@ -4348,7 +4212,6 @@ async def test_retryable_client_update_image_sharegroup_image_delegates_once() -
     )
 
 
-@pytest.mark.asyncio
 async def test_retryable_update_sharegroup_image_requires_a_field() -> None:
     """Shared-image update without label or description raises before the call."""
     retryable = _CapturingRetryableClient()
@@ -4378,7 +4241,6 @@ def test_create_linode_images_sharegroup_image_update_tool_schema() -> None:
     assert "description" in tool.input_schema["properties"]
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_image_update_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -4427,7 +4289,6 @@ async def test_handle_linode_images_sharegroup_image_update_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_image_update_description_only_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -4473,7 +4334,6 @@ async def test_handle_linode_images_sharegroup_image_update_description_only_suc
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm_value", [None, False, "true", 1])
 async def test_handle_linode_images_sharegroup_image_update_requires_literal_confirm(
     confirm_value: object, sample_config: Any, mock_linode_client: AsyncMock
@@ -4495,7 +4355,6 @@ async def test_handle_linode_images_sharegroup_image_update_requires_literal_con
     mock_linode_client.update_image_sharegroup_image.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -4526,7 +4385,6 @@ async def test_handle_linode_images_sharegroup_image_update_rejects_invalid_path
     mock_linode_client.update_image_sharegroup_image.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("arguments", "message"),
     [
@@ -4561,7 +4419,6 @@ async def test_handle_linode_images_sharegroup_image_update_rejects_invalid_body
     mock_linode_client.update_image_sharegroup_image.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_images_sharegroup_image_update_dry_run(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -4612,7 +4469,6 @@ def test_linode_images_sharegroup_image_update_in_version_features() -> None:
     assert "linode_image_sharegroup_image_update" in FEATURE_TOOLS_LIST.split(",")
 
 
-@pytest.mark.asyncio
 async def test_client_delete_image_sends_exact_path() -> None:
     """Low-level client sends DELETE to the documented image path."""
     seen: list[httpx.Request] = []
@@ -4638,7 +4494,6 @@ async def test_client_delete_image_sends_exact_path() -> None:
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 async def test_client_delete_image_raises_api_error() -> None:
     """Low-level client raises APIError for DELETE image HTTP failures."""
 
@@ -4655,7 +4510,6 @@ async def test_client_delete_image_raises_api_error() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_delete_image_delegates_once() -> None:
     """Destructive image delete delegates once without retry replay."""
     client = _CapturingRetryableClient()
@@ -4677,7 +4531,6 @@ def test_linode_image_delete_tool_schema_requires_confirm() -> None:
     assert tool.input_schema["properties"]["confirm"]["type"] == "boolean"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_image_delete_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -4693,7 +4546,6 @@ async def test_handle_linode_image_delete_success(
 
 
 @pytest.mark.parametrize("confirm_value", [None, False, "true", 1])
-@pytest.mark.asyncio
 async def test_handle_linode_image_delete_requires_literal_confirm(
     confirm_value: Any, sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -4722,7 +4574,6 @@ async def test_handle_linode_image_delete_requires_literal_confirm(
         ("private/..", "image_id must be a private image ID like private/<id>"),
     ],
 )
-@pytest.mark.asyncio
 async def test_handle_linode_image_delete_rejects_malformed_image_id(
     image_id: Any, message: str, sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -4735,7 +4586,6 @@ async def test_handle_linode_image_delete_rejects_malformed_image_id(
     mock_linode_client.delete_image.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_image_delete_dry_run(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -11,6 +11,7 @@ go/internal/tools/instance_action_proto_output_test.go.
 from __future__ import annotations
 
 import json
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 
 import pytest
@@ -38,7 +39,6 @@ if TYPE_CHECKING:
 
     from linodemcp.config import Config
 
-pytestmark = pytest.mark.asyncio
 
 _STRONG_PASS = "Str0ngP@ssw0rd!"
 
@@ -227,8 +227,9 @@ async def test_password_reset_two_stage_apply_proto_output(
         }
     )
     mock_linode_client.reset_instance_password.return_value = None
-    sample_config.two_stage = TwoStageConfig(
-        opt_in={"linode_instance_password_reset": True}
+    cfg = replace(
+        sample_config,
+        two_stage=TwoStageConfig(opt_in={"linode_instance_password_reset": True}),
     )
 
     args: dict[str, Any] = {"linode_id": 123, "root_pass": _STRONG_PASS}
@@ -236,13 +237,13 @@ async def test_password_reset_two_stage_apply_proto_output(
     token = set_plan_store(store)
     try:
         plan = await handle_linode_instance_password_reset(
-            {**args, "mode": "plan"}, sample_config
+            {**args, "mode": "plan"}, cfg
         )
         plan_id = json.loads(plan[0].text)["plan_id"]
         assert plan_id
 
         applied = await handle_linode_instance_password_reset(
-            {**args, "mode": "apply", "plan_id": plan_id}, sample_config
+            {**args, "mode": "apply", "plan_id": plan_id}, cfg
         )
         data = json.loads(applied[0].text)
         assert data["message"] == "Root password reset for instance 123"
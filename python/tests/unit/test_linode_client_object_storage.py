@@ -14,8 +14,6 @@ import pytest
 
 from linodemcp.linode import Client, NetworkError
 
-pytestmark = pytest.mark.asyncio
-
 
 def _ok_response(body: Any) -> MagicMock:
     """Build a mock httpx response whose json() returns body."""
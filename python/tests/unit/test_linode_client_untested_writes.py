@@ -21,8 +21,6 @@ from linodemcp.linode import Client, NetworkError
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
-pytestmark = pytest.mark.asyncio
-
 
 def _ok_response(body: Any) -> MagicMock:
     """Build a mock httpx response whose json() returns body."""
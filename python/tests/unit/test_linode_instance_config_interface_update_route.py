@@ -40,7 +40,6 @@ class _FailingRetryableClient(RetryableClient):
         raise AssertionError("mutating update must not use replay retry")
 
 
-@pytest.mark.asyncio
 async def test_client_update_config_interface_sends_method_path_body() -> None:
     seen: list[httpx.Request] = []
 
@@ -79,7 +78,6 @@ async def test_client_update_config_interface_sends_method_path_body() -> None:
     }
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("linode_id", "config_id", "interface_id", "message"),
     [
@@ -124,7 +122,6 @@ async def test_client_update_config_interface_rejects_bad_path_params(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_update_instance_config_interface_no_replay() -> None:
     retryable = _FailingRetryableClient()
     transient = httpx.ReadTimeout("timeout")
@@ -161,7 +158,6 @@ def test_create_linode_instance_config_interface_update_tool_schema() -> None:
     assert "dry_run" not in tool.input_schema["required"]
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_interface_update_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -201,7 +197,6 @@ async def test_handle_linode_instance_config_interface_update_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_client_update_instance_config_interface_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -218,7 +213,6 @@ async def test_client_update_instance_config_interface_translates_http_errors()
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_interface_update_dry_run_skips_client(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -248,7 +242,6 @@ async def test_handle_linode_instance_config_interface_update_dry_run_skips_clie
     mock_linode_client.update_instance_config_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm", [None, False, "true", 1])
 async def test_handle_update_config_interface_requires_confirm_true(
     confirm: Any, sample_config: Any, mock_linode_client: AsyncMock
@@ -273,7 +266,6 @@ async def test_handle_update_config_interface_requires_confirm_true(
     mock_linode_client.update_instance_config_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_interface_update_requires_update_field(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -286,7 +278,6 @@ async def test_handle_linode_instance_config_interface_update_requires_update_fi
     mock_linode_client.update_instance_config_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("field", "value", "message"),
     [
@@ -324,7 +315,6 @@ async def test_handle_linode_instance_config_interface_update_rejects_bad_body_f
     mock_linode_client.update_instance_config_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -52,7 +52,6 @@ class _FailingRetryableClient(RetryableClient):
         raise AssertionError("mutating update must not use replay retry")
 
 
-@pytest.mark.asyncio
 async def test_client_list_instance_interfaces_sends_exact_request() -> None:
     """Low-level client sends GET for the documented instance interfaces path."""
     seen: list[httpx.Request] = []
@@ -79,7 +78,6 @@ async def test_client_list_instance_interfaces_sends_exact_request() -> None:
     assert request.content == b""
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("linode_id", ["1/2", "1?x=2", "..", 0, True])
 async def test_client_list_instance_interfaces_rejects_invalid_linode_id(
     linode_id: Any,
@@ -103,7 +101,6 @@ async def test_client_list_instance_interfaces_rejects_invalid_linode_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_list_instance_interfaces_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -118,7 +115,6 @@ async def test_client_list_instance_interfaces_translates_http_errors() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_list_instance_interfaces_uses_retry() -> None:
     client = RetryableClient("https://api.linode.com/v4", "test-token")
     retryable = cast("Any", client)
@@ -137,7 +133,6 @@ async def test_retryable_list_instance_interfaces_uses_retry() -> None:
     )
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_interfaces_list_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -171,7 +166,6 @@ async def test_handle_linode_instance_interfaces_list_success(
     mock_linode_client.list_instance_interfaces.assert_awaited_once_with(123)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "api_response",
     [{}, {"interfaces": None}, {"unrelated": True}],
@@ -191,7 +185,6 @@ async def test_handle_linode_instance_interfaces_list_accepts_empty_shapes(
     assert json.loads(result[0].text) == {"count": 0, "interfaces": []}
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "interfaces",
     [{}, "", 0, False],
@@ -216,7 +209,6 @@ async def test_handle_linode_instance_interfaces_list_rejects_falsey_non_arrays(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "api_response",
     [[], None, "", 0, False],
@@ -238,7 +230,6 @@ async def test_handle_linode_instance_interfaces_list_rejects_non_object_respons
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("linode_id", ["1/2", "1?x=2", "..", 0, True])
 async def test_handle_linode_instance_interfaces_list_rejects_invalid_linode_id(
     linode_id: Any, sample_config: Any, mock_linode_client: AsyncMock
@@ -251,7 +242,6 @@ async def test_handle_linode_instance_interfaces_list_rejects_invalid_linode_id(
     mock_linode_client.list_instance_interfaces.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_client_get_instance_interface_settings_sends_exact_request() -> None:
     """Low-level client sends GET for the documented interface settings path."""
     seen: list[httpx.Request] = []
@@ -278,7 +268,6 @@ async def test_client_get_instance_interface_settings_sends_exact_request() -> N
     assert request.content == b""
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("linode_id", ["1/2", "1?x=2", "..", 0, -1, True])
 async def test_client_get_instance_interface_settings_rejects_invalid_linode_id(
     linode_id: Any,
@@ -302,7 +291,6 @@ async def test_client_get_instance_interface_settings_rejects_invalid_linode_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_get_instance_interface_settings_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -317,7 +305,6 @@ async def test_client_get_instance_interface_settings_translates_http_errors() -
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_get_instance_interface_settings_uses_retry() -> None:
     client = RetryableClient("https://api.linode.com/v4", "test-token")
     retryable = cast("Any", client)
@@ -336,7 +323,6 @@ async def test_retryable_get_instance_interface_settings_uses_retry() -> None:
     )
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_interface_settings_get_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -352,7 +338,6 @@ async def test_handle_linode_instance_interface_settings_get_success(
     mock_linode_client.get_instance_interface_settings.assert_awaited_once_with(123)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("linode_id", ["1/2", "1?x=2", "..", 0, -1, True])
 async def test_handle_linode_instance_interface_settings_get_rejects_invalid_linode_id(
     linode_id: Any, sample_config: Any, mock_linode_client: AsyncMock
@@ -402,7 +387,6 @@ def test_linode_instance_interfaces_list_registered_and_exported() -> None:
     assert "linode_instance_interface_list" in FEATURE_TOOLS_LIST
 
 
-@pytest.mark.asyncio
 async def test_client_get_instance_interface_sends_exact_request() -> None:
     """Low-level client sends GET for the documented instance interface path."""
     seen: list[httpx.Request] = []
@@ -429,7 +413,6 @@ async def test_client_get_instance_interface_sends_exact_request() -> None:
     assert request.content == b""
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("linode_id", "interface_id"),
     [
@@ -467,7 +450,6 @@ async def test_client_get_instance_interface_rejects_invalid_ids(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_get_instance_interface_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -482,7 +464,6 @@ async def test_client_get_instance_interface_translates_http_errors() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_get_instance_interface_uses_retry() -> None:
     client = RetryableClient("https://api.linode.com/v4", "test-token")
     retryable = cast("Any", client)
@@ -501,7 +482,6 @@ async def test_retryable_get_instance_interface_uses_retry() -> None:
     )
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_interface_get_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -523,7 +503,6 @@ async def test_handle_linode_instance_interface_get_success(
     mock_linode_client.get_instance_interface.assert_awaited_once_with(123, 789)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -571,7 +550,6 @@ def test_linode_instance_interface_get_registered_and_exported() -> None:
     assert "linode_instance_interface_get" in FEATURE_TOOLS_LIST
 
 
-@pytest.mark.asyncio
 async def test_client_add_config_interface_sends_exact_post() -> None:
     """Low-level client sends POST add config interface."""
     seen: list[httpx.Request] = []
@@ -600,7 +578,6 @@ async def test_client_add_config_interface_sends_exact_post() -> None:
     assert json.loads(request.content) == {"purpose": "vlan", "label": "backend"}
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("linode_id", ["1/2", "1?x=2", "..", 0, True])
 async def test_client_add_config_interface_rejects_invalid_linode_id(
     linode_id: Any,
@@ -626,7 +603,6 @@ async def test_client_add_config_interface_rejects_invalid_linode_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("config_id", ["4/5", "4?x=5", "..", 0, False])
 async def test_client_add_config_interface_rejects_invalid_config_id(
     config_id: Any,
@@ -652,7 +628,6 @@ async def test_client_add_config_interface_rejects_invalid_config_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_add_config_interface_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -667,7 +642,6 @@ async def test_client_add_config_interface_translates_http_errors() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("interface", "message"),
     [
@@ -728,7 +702,6 @@ async def test_client_add_config_interface_rejects_invalid_interface_body(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_add_instance_config_interface_no_replay() -> None:
     """Mutating add interface delegates once and does not use generic replay retry."""
     retryable = _FailingRetryableClient()
@@ -768,7 +741,6 @@ def test_create_linode_instance_config_interface_add_tool_schema() -> None:
     assert "dry_run" not in tool.input_schema["required"]
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_interface_add_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -808,7 +780,6 @@ async def test_handle_linode_instance_config_interface_add_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_interface_add_empty_result_message(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -839,7 +810,6 @@ async def test_handle_linode_instance_config_interface_add_empty_result_message(
     }
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_interface_add_dry_run_skips_client(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -873,7 +843,6 @@ async def test_handle_linode_instance_config_interface_add_dry_run_skips_client(
     mock_linode_client.add_instance_config_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm", [None, False, "true", 1])
 async def test_handle_config_interface_add_requires_boolean_confirm_true(
     confirm: Any, sample_config: Any, mock_linode_client: AsyncMock
@@ -895,7 +864,6 @@ async def test_handle_config_interface_add_requires_boolean_confirm_true(
     mock_linode_client.add_instance_config_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("arguments", "message"),
     [
@@ -1015,7 +983,6 @@ async def test_handle_linode_instance_config_interface_add_rejects_invalid_body(
     mock_linode_client.add_instance_config_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -1048,7 +1015,6 @@ def test_linode_instance_config_interface_add_registered_and_exported() -> None:
     assert "linode_instance_config_interface_add" in FEATURE_TOOLS_LIST
 
 
-@pytest.mark.asyncio
 async def test_client_update_instance_config_sends_exact_method_path_and_body() -> None:
     """Low-level client sends PUT /linode/instances/{linodeId}/configs/{configId}."""
     seen: list[httpx.Request] = []
@@ -1101,7 +1067,6 @@ async def test_client_update_instance_config_sends_exact_method_path_and_body()
     }
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "linode_id",
     ["1/2", "1?x=2", "..", 0, True],
@@ -1128,7 +1093,6 @@ async def test_client_update_instance_config_rejects_invalid_linode_id_before_re
     assert called is False
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "config_id",
     ["4/5", "4?x=5", "..", 0, False],
@@ -1155,7 +1119,6 @@ async def test_client_update_instance_config_rejects_invalid_config_id_before_re
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_update_instance_config_no_replay() -> None:
     """Mutating update delegates once and does not use generic replay retry."""
     retryable = _FailingRetryableClient()
@@ -1188,7 +1151,6 @@ def test_create_linode_instance_config_update_tool_schema() -> None:
     assert "virt_mode" in tool.input_schema["properties"]
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_update_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1219,7 +1181,6 @@ async def test_handle_linode_instance_config_update_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_update_empty_result_message(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1245,7 +1206,6 @@ async def test_handle_linode_instance_config_update_empty_result_message(
     assert payload["config"]["label"] == ""
 
 
-@pytest.mark.asyncio
 async def test_client_update_instance_config_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -1260,7 +1220,6 @@ async def test_client_update_instance_config_translates_http_errors() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_update_dry_run_skips_client(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1284,7 +1243,6 @@ async def test_handle_linode_instance_config_update_dry_run_skips_client(
     mock_linode_client.update_instance_config.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm", [None, False, "true", 1])
 async def test_handle_linode_instance_config_update_requires_boolean_confirm_true(
     confirm: Any, sample_config: Any, mock_linode_client: AsyncMock
@@ -1302,7 +1260,6 @@ async def test_handle_linode_instance_config_update_requires_boolean_confirm_tru
     mock_linode_client.update_instance_config.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_update_requires_update_field(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1314,7 +1271,6 @@ async def test_handle_linode_instance_config_update_requires_update_field(
     mock_linode_client.update_instance_config.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_update_rejects_invalid_device_slot(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1333,7 +1289,6 @@ async def test_handle_linode_instance_config_update_rejects_invalid_device_slot(
     mock_linode_client.update_instance_config.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -1366,7 +1321,6 @@ def test_linode_instance_config_update_registered_and_exported() -> None:
     assert "linode_instance_config_update" in FEATURE_TOOLS_LIST
 
 
-@pytest.mark.asyncio
 async def test_client_reorder_interfaces_sends_exact_request() -> None:
     """Low-level client sends the exact reorder request."""
     seen: list[httpx.Request] = []
@@ -1393,7 +1347,6 @@ async def test_client_reorder_interfaces_sends_exact_request() -> None:
     assert json.loads(request.content) == {"ids": [789, 790]}
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("linode_id", ["1/2", "1?x=2", "..", 0, True])
 async def test_client_reorder_interfaces_rejects_invalid_linode_id(
     linode_id: Any,
@@ -1417,7 +1370,6 @@ async def test_client_reorder_interfaces_rejects_invalid_linode_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("config_id", ["4/5", "4?x=5", "..", 0, False])
 async def test_client_reorder_interfaces_rejects_invalid_config_id(
     config_id: Any,
@@ -1441,7 +1393,6 @@ async def test_client_reorder_interfaces_rejects_invalid_config_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("ids", [{"ids": [789]}, [], [0], [True], ["789"]])
 async def test_client_reorder_interfaces_rejects_invalid_ids(ids: Any) -> None:
     called = False
@@ -1463,7 +1414,6 @@ async def test_client_reorder_interfaces_rejects_invalid_ids(ids: Any) -> None:
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_reorder_instance_config_interfaces_no_replay() -> None:
     """Mutating reorder delegates once and does not use generic replay retry."""
     retryable = _FailingRetryableClient()
@@ -1500,7 +1450,6 @@ def test_create_linode_instance_config_interfaces_order_tool_schema() -> None:
     assert "dry_run" in tool.input_schema["properties"]
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_interfaces_order_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1529,7 +1478,6 @@ async def test_handle_linode_instance_config_interfaces_order_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_interfaces_order_dry_run_skips_client(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1560,7 +1508,6 @@ async def test_handle_linode_instance_config_interfaces_order_dry_run_skips_clie
     mock_linode_client.reorder_instance_config_interfaces.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm", [None, False, "true", 1])
 async def test_handle_config_interfaces_order_requires_confirm_true(
     confirm: Any, sample_config: Any, mock_linode_client: AsyncMock
@@ -1600,7 +1547,6 @@ async def test_handle_config_interfaces_order_rejects_duplicate_ids(
     mock_linode_client.reorder_instance_config_interfaces.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -1629,7 +1575,6 @@ async def test_handle_config_interfaces_order_rejects_path_params(
     mock_linode_client.reorder_instance_config_interfaces.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("ids", [None, [], [0], [True], ["789"]])
 async def test_handle_linode_instance_config_interfaces_order_requires_ids(
     ids: Any, sample_config: Any, mock_linode_client: AsyncMock
@@ -1650,7 +1595,6 @@ async def test_handle_linode_instance_config_interfaces_order_requires_ids(
     mock_linode_client.reorder_instance_config_interfaces.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_client_reorder_instance_config_interfaces_translates_http_errors() -> (
     None
 ):
@@ -1681,7 +1625,6 @@ def test_linode_instance_config_interfaces_order_registered_and_exported() -> No
     assert "linode_instance_config_interface_reorder" in FEATURE_TOOLS_LIST
 
 
-@pytest.mark.asyncio
 async def test_client_delete_instance_interface_sends_exact_request() -> None:
     """Low-level client sends DELETE for the documented instance interface path."""
     seen: list[httpx.Request] = []
@@ -1707,7 +1650,6 @@ async def test_client_delete_instance_interface_sends_exact_request() -> None:
     assert request.content == b""
 
 
-@pytest.mark.asyncio
 async def test_client_delete_instance_interface_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -1722,7 +1664,6 @@ async def test_client_delete_instance_interface_translates_http_errors() -> None
         await client.close()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("linode_id", ["1/2", "1?x=2", "..", 0, True])
 async def test_client_delete_instance_interface_rejects_invalid_linode_id(
     linode_id: Any,
@@ -1746,7 +1687,6 @@ async def test_client_delete_instance_interface_rejects_invalid_linode_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("interface_id", ["7/8", "7?x=8", "..", 0, True])
 async def test_client_delete_instance_interface_rejects_invalid_interface_id(
     interface_id: Any,
@@ -1770,7 +1710,6 @@ async def test_client_delete_instance_interface_rejects_invalid_interface_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_delete_instance_interface_no_replay() -> None:
     """Mutating delete delegates once and does not use generic replay retry."""
     retryable = _FailingRetryableClient()
@@ -1804,7 +1743,6 @@ def test_create_linode_instance_interface_delete_tool_schema() -> None:
     assert "dry_run" in tool.input_schema["properties"]
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_interface_delete_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1822,7 +1760,6 @@ async def test_handle_linode_instance_interface_delete_success(
     mock_linode_client.delete_instance_interface.assert_awaited_once_with(123, 789)
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_interface_delete_dry_run_skips_client(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -1846,7 +1783,6 @@ async def test_handle_linode_instance_interface_delete_dry_run_skips_client(
     mock_linode_client.delete_instance_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm", [None, False, "true", 1])
 async def test_handle_instance_interface_delete_requires_confirm_true(
     confirm: Any, sample_config: Any, mock_linode_client: AsyncMock
@@ -1864,7 +1800,6 @@ async def test_handle_instance_interface_delete_requires_confirm_true(
     mock_linode_client.delete_instance_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -1899,7 +1834,6 @@ def test_linode_instance_interface_delete_registered_and_exported() -> None:
     assert "linode_instance_interface_delete" in FEATURE_TOOLS_LIST
 
 
-@pytest.mark.asyncio
 async def test_client_delete_instance_config_interface_sends_exact_request() -> None:
     """Low-level client sends DELETE for the documented config interface path."""
     seen: list[httpx.Request] = []
@@ -1925,7 +1859,6 @@ async def test_client_delete_instance_config_interface_sends_exact_request() ->
     assert request.content == b""
 
 
-@pytest.mark.asyncio
 async def test_client_delete_instance_config_interface_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -1940,7 +1873,6 @@ async def test_client_delete_instance_config_interface_translates_http_errors()
         await client.close()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("linode_id", ["1/2", "1?x=2", "..", 0, True])
 async def test_client_delete_config_interface_rejects_invalid_linode_id(
     linode_id: Any,
@@ -1964,7 +1896,6 @@ async def test_client_delete_config_interface_rejects_invalid_linode_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("config_id", ["4/5", "4?x=5", "..", 0, False])
 async def test_client_delete_config_interface_rejects_invalid_config_id(
     config_id: Any,
@@ -1988,7 +1919,6 @@ async def test_client_delete_config_interface_rejects_invalid_config_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("interface_id", ["7/8", "7?x=8", "..", 0, True])
 async def test_client_delete_config_interface_rejects_invalid_interface_id(
     interface_id: Any,
@@ -2012,7 +1942,6 @@ async def test_client_delete_config_interface_rejects_invalid_interface_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_delete_instance_config_interface_no_replay() -> None:
     """Mutating delete delegates once and does not use generic replay retry."""
     retryable = _FailingRetryableClient()
@@ -2047,7 +1976,6 @@ def test_create_linode_instance_config_interface_delete_tool_schema() -> None:
     assert "dry_run" in tool.input_schema["properties"]
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_interface_delete_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -2071,7 +1999,6 @@ async def test_handle_linode_instance_config_interface_delete_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_config_interface_delete_dry_run_skips_client(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -2099,7 +2026,6 @@ async def test_handle_linode_instance_config_interface_delete_dry_run_skips_clie
     mock_linode_client.delete_instance_config_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm", [None, False, "true", 1])
 async def test_handle_config_interface_delete_requires_confirm_true(
     confirm: Any, sample_config: Any, mock_linode_client: AsyncMock
@@ -2123,7 +2049,6 @@ async def test_handle_config_interface_delete_requires_confirm_true(
     mock_linode_client.delete_instance_config_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -43,7 +43,6 @@ class _FailingRetryableClient(RetryableClient):
         raise AssertionError("mutating update must not use replay retry")
 
 
-@pytest.mark.asyncio
 async def test_client_update_instance_interface_sends_exact_method_path_body() -> None:
     seen: list[httpx.Request] = []
 
@@ -79,7 +78,6 @@ async def test_client_update_instance_interface_sends_exact_method_path_body() -
     }
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("linode_id", "interface_id", "message"),
     [
@@ -119,7 +117,6 @@ async def test_client_update_instance_interface_rejects_bad_path_params(
     assert called is False
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("fields", "error", "message"),
     [
@@ -149,7 +146,6 @@ async def test_client_update_instance_interface_rejects_invalid_body(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_update_instance_interface_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -166,7 +162,6 @@ async def test_client_update_instance_interface_translates_http_errors() -> None
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_update_instance_interface_no_replay() -> None:
     retryable = _FailingRetryableClient()
     transient = httpx.ReadTimeout("timeout")
@@ -198,7 +193,6 @@ def test_create_linode_instance_interface_update_tool_schema() -> None:
     assert "dry_run" not in tool.input_schema["required"]
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_interface_update_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -233,7 +227,6 @@ async def test_handle_linode_instance_interface_update_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_interface_update_empty_result_still_confirms(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -259,7 +252,6 @@ async def test_handle_linode_instance_interface_update_empty_result_still_confir
     }
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_interface_update_dry_run_skips_client(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -286,7 +278,6 @@ async def test_handle_linode_instance_interface_update_dry_run_skips_client(
     mock_linode_client.update_instance_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm", [None, False, "true", 1])
 async def test_handle_update_instance_interface_requires_confirm_true(
     confirm: Any, sample_config: Any, mock_linode_client: AsyncMock
@@ -308,7 +299,6 @@ async def test_handle_update_instance_interface_requires_confirm_true(
     mock_linode_client.update_instance_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_interface_update_requires_update_field(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -321,7 +311,6 @@ async def test_handle_linode_instance_interface_update_requires_update_field(
     mock_linode_client.update_instance_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("field", "value", "message"),
     [
@@ -347,7 +336,6 @@ async def test_handle_linode_instance_interface_update_rejects_bad_body_fields(
     mock_linode_client.update_instance_interface.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -42,7 +42,6 @@ class _CapturingRetryableClient(RetryableClient):
         return await func(*args)
 
 
-@pytest.mark.asyncio
 async def test_client_list_instance_interface_history_sends_exact_request() -> None:
     """Low-level client sends GET /linode/instances/{linodeId}/interfaces/history."""
     seen: list[httpx.Request] = []
@@ -77,7 +76,6 @@ async def test_client_list_instance_interface_history_sends_exact_request() -> N
     assert request.content == b""
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("linode_id", ["1/2", "1?x=2", "..", 0, True])
 async def test_client_list_instance_interface_history_rejects_invalid_linode_id(
     linode_id: Any,
@@ -101,7 +99,6 @@ async def test_client_list_instance_interface_history_rejects_invalid_linode_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_list_instance_interface_history_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -116,7 +113,6 @@ async def test_client_list_instance_interface_history_translates_http_errors() -
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_list_instance_interface_history_uses_read_retry() -> (
     None
 ):
@@ -145,7 +141,6 @@ def test_create_linode_instance_interfaces_history_list_tool_schema() -> None:
     assert tool.input_schema["required"] == ["linode_id"]
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_interfaces_history_list_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -180,7 +175,6 @@ async def test_handle_linode_instance_interfaces_history_list_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -206,7 +200,6 @@ async def test_handle_linode_instance_interfaces_history_list_rejects_invalid_li
     mock_linode_client.list_instance_interface_history.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("arguments", "message"),
     [
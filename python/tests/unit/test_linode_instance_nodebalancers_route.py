@@ -26,7 +26,6 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
-@pytest.mark.asyncio
 async def test_client_list_instance_nodebalancers_sends_exact_request() -> None:
     """Low-level client sends GET for the documented Linode NodeBalancers path."""
     seen: list[httpx.Request] = []
@@ -53,7 +52,6 @@ async def test_client_list_instance_nodebalancers_sends_exact_request() -> None:
     assert request.content == b""
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("linode_id", ["1/2", "1?x=2", "..", 0, True])
 async def test_client_list_instance_nodebalancers_rejects_invalid_linode_id(
     linode_id: Any,
@@ -77,7 +75,6 @@ async def test_client_list_instance_nodebalancers_rejects_invalid_linode_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_list_instance_nodebalancers_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -92,7 +89,6 @@ async def test_client_list_instance_nodebalancers_translates_http_errors() -> No
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_list_instance_nodebalancers_uses_retry() -> None:
     calls: list[int] = []
 
@@ -127,7 +123,6 @@ def test_create_linode_instance_nodebalancers_list_tool_schema() -> None:
     assert tool.input_schema["properties"]["linode_id"]["type"] == "integer"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_nodebalancers_list_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -148,7 +143,6 @@ async def test_handle_linode_instance_nodebalancers_list_success(
     mock_linode_client.list_instance_nodebalancers.assert_awaited_once_with(123)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("linode_id", ["1/2", "1?x=2", "..", 0, True])
 async def test_handle_linode_instance_nodebalancers_list_rejects_invalid_linode_id(
     linode_id: Any, sample_config: Any, mock_linode_client: AsyncMock
@@ -26,7 +26,6 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
-@pytest.mark.asyncio
 async def test_client_get_instance_transfer_sends_exact_request() -> None:
     """Low-level client sends GET for the documented transfer stats path."""
     seen: list[httpx.Request] = []
@@ -53,7 +52,6 @@ async def test_client_get_instance_transfer_sends_exact_request() -> None:
     assert request.content == b""
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("linode_id", "year", "month", "message"),
     [
@@ -100,7 +98,6 @@ async def test_client_get_instance_transfer_rejects_invalid_path_params(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_get_instance_transfer_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -115,7 +112,6 @@ async def test_client_get_instance_transfer_translates_http_errors() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_get_instance_transfer_uses_retry() -> None:
     calls: list[int] = []
 
@@ -153,7 +149,6 @@ def test_create_linode_instance_transfer_month_get_tool_schema() -> None:
         assert tool.input_schema["properties"][field]["type"] == "integer"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_instance_transfer_month_get_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -180,7 +175,6 @@ async def test_handle_linode_instance_transfer_month_get_success(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("arguments", "message"),
     [
@@ -217,7 +211,6 @@ async def test_handle_linode_instance_transfer_month_get_rejects_invalid_path_pa
     mock_linode_client.get_instance_transfer_by_year_month.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("arguments", "message"),
     [
@@ -50,7 +50,6 @@ def test_longview_client_delete_tool_schema() -> None:
     assert tool.input_schema["required"] == ["client_id", "confirm"]
 
 
-@pytest.mark.asyncio
 async def test_longview_client_delete_handler_calls_client(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -72,7 +71,6 @@ async def test_longview_client_delete_handler_calls_client(
     assert "Longview client deleted successfully" in _text(result)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm", [None, False, "true", 1])
 async def test_longview_client_delete_handler_requires_boolean_confirm(
     monkeypatch: pytest.MonkeyPatch, confirm: object
@@ -95,7 +93,6 @@ async def test_longview_client_delete_handler_requires_boolean_confirm(
     assert "Set confirm=true to proceed" in _text(result)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("client_id", [None, 0, -1, True, "123", "1/2", "1?x=2", ".."])
 async def test_longview_client_delete_handler_rejects_invalid_client_id(
     monkeypatch: pytest.MonkeyPatch, client_id: object
@@ -118,7 +115,6 @@ async def test_longview_client_delete_handler_rejects_invalid_client_id(
     assert "client_id" in _text(result)
 
 
-@pytest.mark.asyncio
 async def test_longview_client_delete_handler_dry_run_does_not_call_client(
     sample_config: Any, mock_linode_client: Any
 ) -> None:
@@ -148,7 +144,6 @@ def test_longview_client_get_tool_schema() -> None:
     assert "client_id" in tool.input_schema["properties"]
 
 
-@pytest.mark.asyncio
 async def test_longview_client_get_handler_sanitizes_sensitive_fields(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -175,7 +170,6 @@ async def test_longview_client_get_handler_sanitizes_sensitive_fields(
     assert "install" not in text
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("client_id", [None, 0, -1, True, "123", "1/2", "1?x=2", ".."])
 async def test_longview_client_get_handler_rejects_invalid_client_id(
     monkeypatch: pytest.MonkeyPatch, client_id: object
@@ -224,7 +218,6 @@ def test_longview_clients_list_tool_schema() -> None:
     assert "required" not in tool.input_schema
 
 
-@pytest.mark.asyncio
 async def test_longview_clients_list_handler_calls_client_with_pagination(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -257,7 +250,6 @@ def test_longview_subscriptions_list_tool_schema() -> None:
     assert "required" not in tool.input_schema
 
 
-@pytest.mark.asyncio
 async def test_longview_subscriptions_list_handler_calls_client_with_pagination(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -279,7 +271,6 @@ async def test_longview_subscriptions_list_handler_calls_client_with_pagination(
     assert "longview-3" in _text(result)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("arguments", "message"),
     [
@@ -304,7 +295,6 @@ async def test_longview_subscriptions_list_handler_rejects_invalid_pagination(
     assert message in _text(result)
 
 
-@pytest.mark.asyncio
 async def test_longview_types_list_handler_calls_client(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -326,7 +316,6 @@ async def test_longview_types_list_handler_calls_client(
     assert "g6-standard-2" in _text(result)
 
 
-@pytest.mark.asyncio
 async def test_longview_plan_get_handler_calls_client(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -359,7 +348,6 @@ async def test_longview_plan_get_handler_calls_client(
     assert "not_in_proto" not in text
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("arguments", "message"),
     [
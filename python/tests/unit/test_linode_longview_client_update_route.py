@@ -35,7 +35,6 @@ def _longview_client_json() -> dict[str, Any]:
     }
 
 
-@pytest.mark.asyncio
 async def test_client_update_longview_client_sends_exact_path_and_body() -> None:
     seen: list[httpx.Request] = []
 
@@ -61,7 +60,6 @@ async def test_client_update_longview_client_sends_exact_path_and_body() -> None
     assert json.loads(request.content) == {"label": "updated-client"}
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("client_id", ["1/2", "1?x=2", "..", 0, -1, True])
 async def test_client_update_longview_client_rejects_invalid_client_id(
     client_id: Any,
@@ -85,7 +83,6 @@ async def test_client_update_longview_client_rejects_invalid_client_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_update_longview_client_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -100,7 +97,6 @@ async def test_client_update_longview_client_translates_http_errors() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_update_longview_client_does_not_replay_put() -> None:
     retryable = RetryableClient("https://api.linode.com/v4", "test-token")
     network_error = NetworkError("UpdateLongviewClient", httpx.ConnectTimeout("boom"))
@@ -116,7 +112,6 @@ async def test_retryable_update_longview_client_does_not_replay_put() -> None:
     mock_update.assert_awaited_once_with(123, label="updated-client")
 
 
-@pytest.mark.asyncio
 async def test_client_get_longview_client_sends_exact_path_without_query_or_body() -> (
     None
 ):
@@ -144,7 +139,6 @@ async def test_client_get_longview_client_sends_exact_path_without_query_or_body
     assert request.headers["Authorization"] == "Bearer test-token"
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("client_id", ["1/2", "1?x=2", "..", 0, -1, True])
 async def test_client_get_longview_client_rejects_invalid_client_id(
     client_id: Any,
@@ -168,7 +162,6 @@ async def test_client_get_longview_client_rejects_invalid_client_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_get_longview_client_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -183,7 +176,6 @@ async def test_client_get_longview_client_translates_http_errors() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_get_longview_client_retries_read() -> None:
     retryable = RetryableClient("https://api.linode.com/v4", "test-token")
     mock_get = AsyncMock(return_value={"id": 123})
@@ -213,7 +205,6 @@ def test_create_linode_longview_client_update_tool_schema() -> None:
         assert field not in properties
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_longview_client_update_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -236,7 +227,6 @@ async def test_handle_linode_longview_client_update_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_longview_client_update_dry_run_skips_client(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -256,7 +246,6 @@ async def test_handle_linode_longview_client_update_dry_run_skips_client(
     mock_linode_client.update_longview_client.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm_value", [None, False, "true", 1])
 async def test_handle_linode_longview_client_update_rejects_non_true_confirm(
     confirm_value: Any,
@@ -273,7 +262,6 @@ async def test_handle_linode_longview_client_update_rejects_non_true_confirm(
     mock_linode_client.update_longview_client.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -299,7 +287,6 @@ async def test_handle_linode_longview_client_update_rejects_invalid_arguments(
     mock_linode_client.update_longview_client.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_longview_client_update_reports_client_errors(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -61,7 +61,6 @@ def test_update_alert_definition_tool_schema_requires_confirm() -> None:
     assert tool.input_schema["properties"]["confirm"]["type"] == "boolean"
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm", [None, False, "true", 1])
 async def test_update_alert_definition_requires_explicit_boolean_confirm(
     monkeypatch: pytest.MonkeyPatch, confirm: object
@@ -79,7 +78,6 @@ async def test_update_alert_definition_requires_explicit_boolean_confirm(
     assert "confirm=true" in _text(result)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("service_type", ["bad/type", "bad?type", "..", "bad type"])
 async def test_update_alert_definition_rejects_malformed_service_type(
     monkeypatch: pytest.MonkeyPatch, service_type: str
@@ -95,7 +93,6 @@ async def test_update_alert_definition_rejects_malformed_service_type(
     assert "service_type" in _text(result)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("alert_id", [True, "42", 4.2, 0, -1])
 async def test_update_alert_definition_rejects_invalid_alert_id(
     monkeypatch: pytest.MonkeyPatch, alert_id: object
@@ -111,7 +108,6 @@ async def test_update_alert_definition_rejects_invalid_alert_id(
     assert "alert_id" in _text(result)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -139,7 +135,6 @@ async def test_update_alert_definition_rejects_empty_update_payload(
     assert "update field" in _text(result)
 
 
-@pytest.mark.asyncio
 async def test_update_alert_definition_calls_client_once_without_retry(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -169,7 +164,6 @@ async def test_update_alert_definition_calls_client_once_without_retry(
     assert "Monitor alert definition 42 updated" in _text(result)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("bad_args", "expected"),
     [
@@ -194,7 +188,6 @@ async def test_alert_definition_list_validates_pagination(
     assert expected in _text(result)
 
 
-@pytest.mark.asyncio
 async def test_service_list_emits_proto_envelope(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -221,7 +214,6 @@ async def test_service_list_emits_proto_envelope(
     assert "page" not in text
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "handler",
     [
@@ -241,7 +233,6 @@ async def test_list_handlers_reject_invalid_pagination(
     assert "page must be an integer greater than or equal to 1" in _text(result)
 
 
-@pytest.mark.asyncio
 async def test_alert_channel_list_emits_proto_envelope(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -276,7 +267,6 @@ async def test_alert_channel_list_emits_proto_envelope(
     client.list_monitor_alert_channels.assert_awaited_once_with(page=2, page_size=50)
 
 
-@pytest.mark.asyncio
 async def test_service_metric_definition_list_emits_proto_envelope(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -310,7 +300,6 @@ async def test_service_metric_definition_list_emits_proto_envelope(
     client.list_monitor_service_metric_definitions.assert_awaited_once_with("dbaas")
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "handler",
     [
@@ -329,7 +318,6 @@ async def test_service_definition_list_rejects_bad_service_type(
     assert "service_type is required" in _text(result)
 
 
-@pytest.mark.asyncio
 async def test_metric_query_emits_proto_envelope(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -357,7 +345,6 @@ async def test_metric_query_emits_proto_envelope(
     client.read_monitor_service_metrics.assert_awaited_once_with("dbaas")
 
 
-@pytest.mark.asyncio
 async def test_alert_definition_create_emits_proto_envelope(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -394,7 +381,6 @@ async def test_alert_definition_create_emits_proto_envelope(
     assert "service_type" not in body
 
 
-@pytest.mark.asyncio
 async def test_alert_definition_update_emits_proto_envelope(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -430,7 +416,6 @@ async def test_alert_definition_update_emits_proto_envelope(
     assert "alert_id" not in body
 
 
-@pytest.mark.asyncio
 async def test_alert_definition_delete_emits_proto_envelope(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
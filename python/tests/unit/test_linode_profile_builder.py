@@ -105,7 +105,6 @@ def test_list_tools_registration() -> None:
     assert capability is Capability.Meta
 
 
-@pytest.mark.asyncio
 async def test_list_tools_returns_all_entries_unfiltered() -> None:
     """No-filter path: every catalog entry appears with name and capability."""
     entries = await _call_list_tools({})
@@ -117,7 +116,6 @@ async def test_list_tools_returns_all_entries_unfiltered() -> None:
     assert by_name["hello"] == "CapMeta"
 
 
-@pytest.mark.asyncio
 async def test_list_tools_categories_populated() -> None:
     """Categories field is the resolved categories() output, not empty.
 
@@ -144,7 +142,6 @@ async def test_list_tools_categories_populated() -> None:
     assert "core" in by_name["hello"]
 
 
-@pytest.mark.asyncio
 async def test_list_tools_category_filter_matches() -> None:
     """Exact-match category filter narrows output to one entry."""
     entries = await _call_list_tools({_ARG_CATEGORY: _DNS_CATEGORY})
@@ -153,7 +150,6 @@ async def test_list_tools_category_filter_matches() -> None:
     assert entries[0]["name"] == "linode_domain_get"
 
 
-@pytest.mark.asyncio
 async def test_list_tools_category_filter_rejects_unknown() -> None:
     """Empty-result path: unknown category returns zero entries.
 
@@ -165,7 +161,6 @@ async def test_list_tools_category_filter_rejects_unknown() -> None:
     assert entries == []
 
 
-@pytest.mark.asyncio
 async def test_list_tools_capability_filter_long_form() -> None:
     """CapXxx form matches; used by callers round-tripping prior responses."""
     entries = await _call_list_tools({_ARG_CAPABILITY: "CapWrite"})
@@ -174,7 +169,6 @@ async def test_list_tools_capability_filter_long_form() -> None:
     assert entries[0]["name"] == "linode_instance_boot"
 
 
-@pytest.mark.asyncio
 async def test_list_tools_capability_filter_short_form() -> None:
     """Short form ('write') matches the same set as the long form."""
     entries = await _call_list_tools({_ARG_CAPABILITY: "write"})
@@ -183,7 +177,6 @@ async def test_list_tools_capability_filter_short_form() -> None:
     assert entries[0]["name"] == "linode_instance_boot"
 
 
-@pytest.mark.asyncio
 async def test_list_tools_capability_filter_case_insensitive() -> None:
     """Case folding applies to both short and long forms.
 
@@ -199,7 +192,6 @@ async def test_list_tools_capability_filter_case_insensitive() -> None:
     assert mixed[0]["name"] == "linode_domain_get"
 
 
-@pytest.mark.asyncio
 async def test_list_tools_combined_filters() -> None:
     """AND semantics: a tool must match both filters to appear."""
     match_entries = await _call_list_tools(
@@ -214,7 +206,6 @@ async def test_list_tools_combined_filters() -> None:
     assert miss_entries == []
 
 
-@pytest.mark.asyncio
 async def test_list_tools_empty_catalog_returns_empty_array() -> None:
     """JSON shape on the empty path: ``[]`` not ``null``.
 
@@ -228,7 +219,6 @@ async def test_list_tools_empty_catalog_returns_empty_array() -> None:
     assert _parse_envelope_list(response[0].text, "tools") == []
 
 
-@pytest.mark.asyncio
 async def test_list_tools_no_bridge_returns_empty() -> None:
     """When no bridge is installed the handler returns an empty list.
 
@@ -252,7 +242,6 @@ def test_list_categories_registration() -> None:
     assert capability is Capability.Meta
 
 
-@pytest.mark.asyncio
 async def test_list_categories_returns_deduplicated_counts() -> None:
     """Substantive behavior: every category appears with the right count.
 
@@ -275,7 +264,6 @@ async def test_list_categories_returns_deduplicated_counts() -> None:
     assert "compute_actions" not in counts
 
 
-@pytest.mark.asyncio
 async def test_list_categories_sorted_by_name() -> None:
     """Stable output: sorted ascending by name.
 
@@ -289,7 +277,6 @@ async def test_list_categories_sorted_by_name() -> None:
     assert names == sorted(names)
 
 
-@pytest.mark.asyncio
 async def test_list_categories_empty_catalog_returns_empty_array() -> None:
     """Empty catalog serializes as ``[]`` not ``null``."""
     set_tool_catalog_provider(list)
@@ -107,7 +107,6 @@ def test_draft_new_registration() -> None:
     assert capability is Capability.Meta
 
 
-@pytest.mark.asyncio
 async def test_draft_new_creates_empty_draft(install_fixtures: Registry) -> None:
     """No-clone-from happy path: empty draft created and registered."""
     response = await handle_linode_profile_draft_new({"name": _DRAFT_FIXTURE_NAME})
@@ -125,7 +124,6 @@ async def test_draft_new_creates_empty_draft(install_fixtures: Registry) -> None
     )
 
 
-@pytest.mark.asyncio
 async def test_draft_new_clones_from_source() -> None:
     """Clone path: every field on the source profile lands on the draft."""
     response = await handle_linode_profile_draft_new(
@@ -142,14 +140,12 @@ async def test_draft_new_clones_from_source() -> None:
     assert payload["allow_yolo"] is src.allow_yolo
 
 
-@pytest.mark.asyncio
 async def test_draft_new_refuses_missing_name() -> None:
     """Empty name raises DraftNameMissingError (validation guard)."""
     with pytest.raises(DraftNameMissingError):
         await handle_linode_profile_draft_new({})
 
 
-@pytest.mark.asyncio
 async def test_draft_new_refuses_unknown_clone_source(
     install_fixtures: Registry,
 ) -> None:
@@ -165,7 +161,6 @@ async def test_draft_new_refuses_unknown_clone_source(
     )
 
 
-@pytest.mark.asyncio
 async def test_draft_new_refuses_duplicate_name() -> None:
     """Second create with the same name surfaces DraftExistsError."""
     await handle_linode_profile_draft_new({"name": _DRAFT_FIXTURE_NAME})
@@ -183,7 +178,6 @@ def test_draft_show_registration() -> None:
     assert capability is Capability.Meta
 
 
-@pytest.mark.asyncio
 async def test_draft_show_returns_live_draft_state(
     install_fixtures: Registry,
 ) -> None:
@@ -203,7 +197,6 @@ async def test_draft_show_returns_live_draft_state(
     assert payload["allowed_tools"] == list(src.allowed_tools)
 
 
-@pytest.mark.asyncio
 async def test_draft_show_refuses_unknown() -> None:
     """Unknown name raises DraftNotFoundError (no silent empty response)."""
     with pytest.raises(DraftNotFoundError) as excinfo:
@@ -212,7 +205,6 @@ async def test_draft_show_refuses_unknown() -> None:
     assert excinfo.value.draft_name == "nonexistent-draft"
 
 
-@pytest.mark.asyncio
 async def test_draft_show_refuses_missing_name() -> None:
     """Empty name raises DraftNameMissingError."""
     with pytest.raises(DraftNameMissingError):
@@ -228,7 +220,6 @@ def test_draft_discard_registration() -> None:
     assert capability is Capability.Meta
 
 
-@pytest.mark.asyncio
 async def test_draft_discard_removes_draft(install_fixtures: Registry) -> None:
     """Happy path: discard returns discarded=True and removes from registry."""
     install_fixtures.create(_DRAFT_FIXTURE_NAME)
@@ -241,7 +232,6 @@ async def test_draft_discard_removes_draft(install_fixtures: Registry) -> None:
     assert install_fixtures.get(_DRAFT_FIXTURE_NAME) is None
 
 
-@pytest.mark.asyncio
 async def test_draft_discard_idempotent() -> None:
     """Discarding an absent draft returns discarded=False, not an error.
 
@@ -255,7 +245,6 @@ async def test_draft_discard_idempotent() -> None:
     assert payload["discarded"] is False
 
 
-@pytest.mark.asyncio
 async def test_draft_discard_refuses_missing_name() -> None:
     """Empty name raises DraftNameMissingError (mirrors _new and _show)."""
     with pytest.raises(DraftNameMissingError):
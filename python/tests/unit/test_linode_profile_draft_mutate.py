@@ -87,7 +87,6 @@ def test_add_tools_registration() -> None:
     assert capability is Capability.Meta
 
 
-@pytest.mark.asyncio
 async def test_add_tools_adds_literals(install_fixtures: Registry) -> None:
     """No-wildcard path: literal names match the catalog and land on the draft."""
     install_fixtures.create(_MUTATE_DRAFT_NAME)
@@ -106,7 +105,6 @@ async def test_add_tools_adds_literals(install_fixtures: Registry) -> None:
     assert sorted(draft.allowed_tools) == [_TOOL_HELLO, _TOOL_INSTANCE_BOOT]
 
 
-@pytest.mark.asyncio
 async def test_add_tools_expands_wildcards(install_fixtures: Registry) -> None:
     """Wildcard path: linode_instance_* expands to boot + reboot + shutdown."""
     install_fixtures.create(_MUTATE_DRAFT_NAME)
@@ -125,7 +123,6 @@ async def test_add_tools_expands_wildcards(install_fixtures: Registry) -> None:
     ]
 
 
-@pytest.mark.asyncio
 async def test_add_tools_dedupes_against_existing(
     install_fixtures: Registry,
 ) -> None:
@@ -147,7 +144,6 @@ async def test_add_tools_dedupes_against_existing(
     assert draft.allowed_tools == [_TOOL_HELLO]
 
 
-@pytest.mark.asyncio
 async def test_add_tools_refuses_unknown_draft() -> None:
     """Add on a nonexistent draft raises DraftNotFoundError."""
     with pytest.raises(DraftNotFoundError):
@@ -156,7 +152,6 @@ async def test_add_tools_refuses_unknown_draft() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_add_tools_refuses_missing_name() -> None:
     """Empty name raises DraftNameMissingError."""
     with pytest.raises(DraftNameMissingError):
@@ -172,7 +167,6 @@ def test_remove_tools_registration() -> None:
     assert capability is Capability.Meta
 
 
-@pytest.mark.asyncio
 async def test_remove_tools_removes_literals(install_fixtures: Registry) -> None:
     """Happy path: literal names matched against the draft's existing tools."""
     draft = install_fixtures.create(_MUTATE_DRAFT_NAME)
@@ -190,7 +184,6 @@ async def test_remove_tools_removes_literals(install_fixtures: Registry) -> None
     assert sorted(updated.allowed_tools) == [_TOOL_INSTANCE_BOOT, _TOOL_INSTANCE_REBOOT]
 
 
-@pytest.mark.asyncio
 async def test_remove_tools_expands_wildcards_against_draft(
     install_fixtures: Registry,
 ) -> None:
@@ -215,7 +208,6 @@ async def test_remove_tools_expands_wildcards_against_draft(
     assert updated.allowed_tools == [_TOOL_HELLO]
 
 
-@pytest.mark.asyncio
 async def test_remove_tools_no_match_is_benign(install_fixtures: Registry) -> None:
     """No-match returns an empty removed list and leaves the draft unchanged."""
     draft = install_fixtures.create(_MUTATE_DRAFT_NAME)
@@ -233,7 +225,6 @@ async def test_remove_tools_no_match_is_benign(install_fixtures: Registry) -> No
     assert updated.allowed_tools == [_TOOL_HELLO]
 
 
-@pytest.mark.asyncio
 async def test_remove_tools_refuses_unknown_draft() -> None:
     """Remove on a nonexistent draft raises DraftNotFoundError."""
     with pytest.raises(DraftNotFoundError):
@@ -251,7 +242,6 @@ def test_set_registration() -> None:
     assert capability is Capability.Meta
 
 
-@pytest.mark.asyncio
 async def test_set_environments_only(install_fixtures: Registry) -> None:
     """Only specified fields are written; others stay at their prior value."""
     draft = install_fixtures.create(_MUTATE_DRAFT_NAME)
@@ -278,7 +268,6 @@ async def test_set_environments_only(install_fixtures: Registry) -> None:
     assert updated.allow_yolo is True
 
 
-@pytest.mark.asyncio
 async def test_set_allow_yolo_flips_cleanly(install_fixtures: Registry) -> None:
     """allow_yolo=true on a draft that started false is a material change."""
     install_fixtures.create(_MUTATE_DRAFT_NAME)
@@ -297,7 +286,6 @@ async def test_set_allow_yolo_flips_cleanly(install_fixtures: Registry) -> None:
     assert updated.allow_yolo is True
 
 
-@pytest.mark.asyncio
 async def test_set_multiple_fields_at_once(install_fixtures: Registry) -> None:
     """A single call can update every settable field."""
     install_fixtures.create(_MUTATE_DRAFT_NAME)
@@ -317,7 +305,6 @@ async def test_set_multiple_fields_at_once(install_fixtures: Registry) -> None:
     assert len(cast("dict[str, object]", changes)) == 3
 
 
-@pytest.mark.asyncio
 async def test_set_empty_call_no_ops(install_fixtures: Registry) -> None:
     """Call with just name returns empty changes and writes no fields."""
     install_fixtures.create(_MUTATE_DRAFT_NAME)
@@ -330,7 +317,6 @@ async def test_set_empty_call_no_ops(install_fixtures: Registry) -> None:
     assert changes == {}
 
 
-@pytest.mark.asyncio
 async def test_set_refuses_unknown_draft() -> None:
     """Set on a nonexistent draft raises DraftNotFoundError."""
     with pytest.raises(DraftNotFoundError):
@@ -339,7 +325,6 @@ async def test_set_refuses_unknown_draft() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_set_refuses_missing_name() -> None:
     """Empty name raises DraftNameMissingError."""
     with pytest.raises(DraftNameMissingError):
@@ -89,7 +89,6 @@ def test_save_registration() -> None:
     assert capability is Capability.Meta
 
 
-@pytest.mark.asyncio
 async def test_save_creates_new_profile(
     install_fixtures: Registry,
     writable_config: Path,
@@ -121,7 +120,6 @@ async def test_save_creates_new_profile(
     assert sorted(stored.allowed_tools) == [_TOOL_HELLO, _TOOL_INSTANCE_BOOT]
 
 
-@pytest.mark.asyncio
 async def test_save_updates_existing_profile(
     install_fixtures: Registry,
     writable_config: Path,
@@ -162,7 +160,6 @@ async def test_save_updates_existing_profile(
     assert desc_typed["new"] == "updated"
 
 
-@pytest.mark.asyncio
 async def test_save_refuses_missing_confirm(
     install_fixtures: Registry,
     writable_config: Path,
@@ -181,7 +178,6 @@ async def test_save_refuses_missing_confirm(
     )
 
 
-@pytest.mark.asyncio
 async def test_save_refuses_builtin_name(
     install_fixtures: Registry,
     writable_config: Path,
@@ -198,7 +194,6 @@ async def test_save_refuses_builtin_name(
     assert excinfo.value.profile_name == "compute-admin"
 
 
-@pytest.mark.asyncio
 async def test_save_refuses_unknown_draft(writable_config: Path) -> None:
     """Save on a nonexistent draft raises DraftNotFoundError."""
     set_save_config_path_provider(lambda: str(writable_config))
@@ -209,14 +204,12 @@ async def test_save_refuses_unknown_draft(writable_config: Path) -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_save_refuses_missing_name() -> None:
     """Empty name raises DraftNameMissingError."""
     with pytest.raises(DraftNameMissingError):
         await handle_linode_profile_draft_save({"confirm": True})
 
 
-@pytest.mark.asyncio
 async def test_save_response_has_expected_shape(
     install_fixtures: Registry,
     writable_config: Path,
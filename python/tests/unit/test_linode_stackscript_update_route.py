@@ -38,7 +38,6 @@ def _stackscript_json() -> dict[str, Any]:
     }
 
 
-@pytest.mark.asyncio
 async def test_client_update_stackscript_sends_exact_path_and_body() -> None:
     seen: list[httpx.Request] = []
 
@@ -79,7 +78,6 @@ async def test_client_update_stackscript_sends_exact_path_and_body() -> None:
     }
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("stackscript_id", ["1/2", "1?x=2", "..", 0, -1, True])
 async def test_client_update_stackscript_rejects_invalid_stackscript_id(
     stackscript_id: Any,
@@ -105,7 +103,6 @@ async def test_client_update_stackscript_rejects_invalid_stackscript_id(
     assert called is False
 
 
-@pytest.mark.asyncio
 async def test_client_update_stackscript_translates_http_errors() -> None:
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.ReadTimeout("timeout")
@@ -120,7 +117,6 @@ async def test_client_update_stackscript_translates_http_errors() -> None:
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_client_update_stackscript_does_not_replay_put() -> None:
     retryable = RetryableClient("https://api.linode.com/v4", "test-token")
     network_error = NetworkError("UpdateStackScript", httpx.ConnectTimeout("boom"))
@@ -159,7 +155,6 @@ def test_create_linode_stackscript_update_tool_schema() -> None:
     assert properties["dry_run"]["type"] == "boolean"
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_stackscript_update_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -197,7 +192,6 @@ async def test_handle_linode_stackscript_update_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_stackscript_update_dry_run_skips_client(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -222,7 +216,6 @@ async def test_handle_linode_stackscript_update_dry_run_skips_client(
     mock_linode_client.update_stackscript.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm_value", [None, False, "true", 1])
 async def test_handle_linode_stackscript_update_rejects_non_true_confirm(
     confirm_value: Any, sample_config: Any, mock_linode_client: AsyncMock
@@ -237,7 +230,6 @@ async def test_handle_linode_stackscript_update_rejects_non_true_confirm(
     mock_linode_client.update_stackscript.assert_not_called()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
@@ -264,7 +256,6 @@ async def test_handle_linode_stackscript_update_rejects_invalid_arguments(
     mock_linode_client.update_stackscript.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_stackscript_update_reports_client_errors(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -41,7 +41,6 @@ def _stackscript(stackscript_id: int = 123) -> StackScript:
     return StackScript(**data)
 
 
-@pytest.mark.asyncio
 async def test_client_get_stackscript_sends_exact_route() -> None:
     """Low-level client sends GET /linode/stackscripts/{stackscriptId}."""
     client = Client("https://api.linode.com/v4", "test-token")
@@ -60,7 +59,6 @@ async def test_client_get_stackscript_sends_exact_route() -> None:
     await client.close()
 
 
-@pytest.mark.asyncio
 async def test_client_get_stackscript_url_encodes_stackscript_id() -> None:
     """Low-level client URL-encodes StackScript IDs at the path boundary."""
     client = Client("https://api.linode.com/v4", "test-token")
@@ -79,7 +77,6 @@ async def test_client_get_stackscript_url_encodes_stackscript_id() -> None:
     await client.close()
 
 
-@pytest.mark.asyncio
 async def test_client_get_stackscript_wraps_http_error() -> None:
     """StackScript get wraps client HTTP errors."""
     client = Client("https://api.linode.com/v4", "test-token")
@@ -93,7 +90,6 @@ async def test_client_get_stackscript_wraps_http_error() -> None:
     await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_get_stackscript_delegates_with_retry() -> None:
     """Retryable client delegates read-only StackScript get through retry."""
     client = RetryableClient("https://api.linode.com/v4", "test-token")
@@ -122,7 +118,6 @@ def test_create_linode_stackscript_get_tool_schema() -> None:
     assert "stackscript_id" in tool.input_schema["properties"]
 
 
-@pytest.mark.asyncio
 async def test_handle_linode_stackscript_get_success(
     sample_config: Any, mock_linode_client: AsyncMock
 ) -> None:
@@ -151,7 +146,6 @@ async def test_handle_linode_stackscript_get_success(
     mock_linode_client.get_raw.assert_awaited_once_with("/linode/stackscripts/123")
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "arguments",
     [
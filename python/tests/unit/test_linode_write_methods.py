@@ -20,8 +20,6 @@ from linodemcp.linode import (
     Volume,
 )
 
-pytestmark = pytest.mark.asyncio
-
 
 def _ok_response(body: Any) -> MagicMock:
     """Build a mock httpx response whose json() returns body."""
@@ -24,8 +24,6 @@ from linodemcp.tools.linode_lke_write import (
 if TYPE_CHECKING:
     from linodemcp.config import Config
 
-pytestmark = pytest.mark.asyncio
-
 
 def _mock_client(**returns: Any) -> AsyncMock:
     """Build an async-context-manager client mock with canned return values."""
@@ -16,7 +16,6 @@ def _text(result: list[Any]) -> str:
     return str(result[0].text)
 
 
-@pytest.mark.asyncio
 async def test_client_clone_posts_escaped_path_and_preserves_empty_overrides() -> None:
     client = Client("https://api.linode.com/v4", "test-token")
     response = MagicMock()
@@ -58,7 +57,6 @@ async def test_client_clone_posts_escaped_path_and_preserves_empty_overrides() -
     await client.close()
 
 
-@pytest.mark.asyncio
 async def test_client_clone_omits_absent_optional_fields() -> None:
     client = Client("https://api.linode.com/v4", "test-token")
     response = MagicMock()
@@ -75,7 +73,6 @@ async def test_client_clone_omits_absent_optional_fields() -> None:
     await client.close()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("kwargs", "message"),
     [
@@ -186,7 +183,6 @@ async def test_client_clone_rejects_invalid_inputs_before_request(
     await client.close()
 
 
-@pytest.mark.asyncio
 async def test_retryable_clone_does_not_retry_transient_failure() -> None:
     retryable = RetryableClient(
         "https://api.linode.com/v4",
@@ -211,7 +207,6 @@ async def test_retryable_clone_does_not_retry_transient_failure() -> None:
     await retryable.close()
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "failure",
     [
@@ -266,7 +261,6 @@ def test_clone_tool_is_exported_with_write_capability_and_contract_schema() -> N
     }
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("confirm", [None, False, "true", 1])
 async def test_clone_requires_explicit_boolean_confirmation(
     monkeypatch: pytest.MonkeyPatch, confirm: object
@@ -292,7 +286,6 @@ async def test_clone_requires_explicit_boolean_confirmation(
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("field", "value", "message"),
     [
@@ -336,7 +329,6 @@ async def test_clone_handler_rejects_invalid_fields(
     assert message in _text(result)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("arguments", "message"),
     [
@@ -438,7 +430,6 @@ async def test_clone_target_validation_matches_go_exactly(
     assert _text(result) == f"Error: {message}"
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("field", "value", "message"),
     [
@@ -480,7 +471,6 @@ async def test_clone_rejects_invalid_numeric_fields(
     assert _text(result) == f"Error: {message}"
 
 
-@pytest.mark.asyncio
 async def test_clone_success_coerces_integral_floats_and_preserves_scoped_response(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -543,7 +533,6 @@ async def test_clone_success_coerces_integral_floats_and_preserves_scoped_respon
     assert payload["alert_definition"]["regions"] == ["us-east", "us-iad"]
 
 
-@pytest.mark.asyncio
 async def test_clone_dry_run_previews_post_body_and_fetches_source(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
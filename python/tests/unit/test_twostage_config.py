@@ -8,6 +8,7 @@ TestSettings* and TestTwoStageConfig* tests.
 from __future__ import annotations
 
 import json
+from dataclasses import replace
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
@@ -77,13 +78,13 @@ async def test_config_ttl_override_drives_plan_lifetime(
     mock_linode_client.get_instance.return_value = parse_instance(
         {"id": 123, "status": "running"}
     )
-    sample_config.two_stage = TwoStageConfig(default_plan_ttl_seconds=60)
+    cfg = replace(sample_config, two_stage=TwoStageConfig(default_plan_ttl_seconds=60))
 
     store = PlanStore()
     token = set_plan_store(store)
     try:
         result = await handle_linode_instance_delete(
-            {"instance_id": 123, "mode": "plan"}, sample_config
+            {"instance_id": 123, "mode": "plan"}, cfg
         )
         body = json.loads(result[0].text)
         created = datetime.fromisoformat(body["created_at"])
@@ -99,15 +100,16 @@ async def test_config_per_tool_ttl_override(
     mock_linode_client.get_instance.return_value = parse_instance(
         {"id": 123, "status": "running"}
     )
-    sample_config.two_stage = TwoStageConfig(
-        tool_ttl_seconds={"linode_instance_delete": 120}
+    cfg = replace(
+        sample_config,
+        two_stage=TwoStageConfig(tool_ttl_seconds={"linode_instance_delete": 120}),
     )
 
     store = PlanStore()
     token = set_plan_store(store)
     try:
         result = await handle_linode_instance_delete(
-            {"instance_id": 123, "mode": "plan"}, sample_config
+            {"instance_id": 123, "mode": "plan"}, cfg
         )
         body = json.loads(result[0].text)
         created = datetime.fromisoformat(body["created_at"])
@@ -123,13 +125,16 @@ async def test_config_opt_out_falls_through(
     mock_linode_client.get_instance.return_value = parse_instance(
         {"id": 123, "status": "running"}
     )
-    sample_config.two_stage = TwoStageConfig(opt_in={"linode_instance_delete": False})
+    cfg = replace(
+        sample_config,
+        two_stage=TwoStageConfig(opt_in={"linode_instance_delete": False}),
+    )
 
     store = PlanStore()
     token = set_plan_store(store)
     try:
         result = await handle_linode_instance_delete(
-            {"instance_id": 123, "mode": "plan"}, sample_config
+            {"instance_id": 123, "mode": "plan"}, cfg
         )
         # Opted out: two-stage returns None, the handler falls through to the
         # normal flow, which refuses without confirm. No plan is stored.
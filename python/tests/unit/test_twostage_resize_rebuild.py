@@ -8,6 +8,7 @@ two_stage config. Both carry their dependency walk into the plan body.
 from __future__ import annotations
 
 import json
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 
 from linodemcp.config import TwoStageConfig
@@ -67,16 +68,16 @@ async def test_resize_plan_then_apply_opted_in(
         {"id": 123, "type": "g6-nanode-1"}
     )
     mock_linode_client.list_instance_disks.return_value = []
-    sample_config.two_stage = TwoStageConfig(opt_in={"linode_instance_resize": True})
+    cfg = replace(
+        sample_config, two_stage=TwoStageConfig(opt_in={"linode_instance_resize": True})
+    )
 
     resize_args: dict[str, Any] = {"instance_id": 123, "type": "g6-standard-1"}
 
     store = PlanStore()
     token = set_plan_store(store)
     try:
-        plan = await handle_linode_instance_resize(
-            {**resize_args, "mode": "plan"}, sample_config
-        )
+        plan = await handle_linode_instance_resize({**resize_args, "mode": "plan"}, cfg)
         body = json.loads(plan[0].text)
         plan_id = body["plan_id"]
         assert plan_id
@@ -87,7 +88,7 @@ async def test_resize_plan_then_apply_opted_in(
         mock_linode_client.resize_instance.assert_not_awaited()
 
         result = await handle_linode_instance_resize(
-            {**resize_args, "mode": "apply", "plan_id": plan_id}, sample_config
+            {**resize_args, "mode": "apply", "plan_id": plan_id}, cfg
         )
         assert "Error" not in result[0].text
         # The apply body is proto-canonical, same shape as the single-step path.